@@ -21,6 +21,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 推理/编造词汇（按优先级排列），编译为单次扫描的正则
+_INFERENCE_WORDS = ("应该是", "可能是", "估计", "大概", "推测", "假设", "猜测")
+_INFERENCE_RE = re.compile("|".join(map(re.escape, _INFERENCE_WORDS)))
+
 
 class CheckpointStatus(Enum):
     """Checkpoint validation status."""
@@ -279,11 +283,11 @@ class QualityCheckpoints:
 
         Returns the first found inference word, or None if clean.
         """
-        fabrication_words = ["应该是", "可能是", "估计", "大概", "推测", "假设", "猜测"]
-        for word in fabrication_words:
-            if word in content:
-                return word
-        return None
+        # Clean content (the common case) is settled by one regex pass
+        if not _INFERENCE_RE.search(content):
+            return None
+        # Keep the priority order of the word list when several are present
+        return next(word for word in _INFERENCE_WORDS if word in content)
 
     def _check_format_compliance(self, content: str) -> List[str]:
         """
@@ -16,18 +16,27 @@ from app.knowledge import get_knowledge_manager
 logger = logging.getLogger(__name__)
 
 
-def get_llm() -> ChatOpenAI:
+def get_llm(http_async_client: Optional[Any] = None) -> ChatOpenAI:
     """
     Get configured LLM instance.
 
     Uses DeepSeek API with OpenAI-compatible interface.
+
+    Args:
+        http_async_client: Optional shared httpx.AsyncClient, so several LLM
+            instances reuse the same pooled TCP/TLS connections
     """
+    kwargs = {}
+    if http_async_client is not None:
+        kwargs["http_async_client"] = http_async_client
+
     return ChatOpenAI(
         model=settings.DEEPSEEK_MODEL,
         openai_api_key=settings.DEEPSEEK_API_KEY,
         openai_api_base=settings.DEEPSEEK_BASE_URL,
         temperature=0.1,  # Low temperature for consistent output
         max_tokens=8000,  # Enough for detailed reports
+        **kwargs
     )
 
 
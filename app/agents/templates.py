@@ -175,6 +175,19 @@ def get_fix_suggestion(violation_type: FormatViolationType, line: str) -> str:
     return suggestions.get(violation_type, "请修正格式问题")
 
 
+# Compiled once for convert_markdown_to_plain_text
+_HEADING_RE = re.compile(r'^#{1,6}\s*', re.MULTILINE)
+_BULLET_LINE_RE = re.compile(r'^[\s]*[-*•○]\s*(.+)$')
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_BOLD_OPEN_RE = re.compile(r'\*\*([^*]+)$', re.MULTILINE)
+_BOLD_CLOSE_RE = re.compile(r'^([^*]+)\*\*', re.MULTILINE)
+_STAR_ITALIC_RE = re.compile(r'(?<!\*)\*([^*]+)\*(?!\*)')
+_UNDERSCORE_ITALIC_RE = re.compile(r'_([^_]+)_')
+_INLINE_CODE_RE = re.compile(r'`([^`]+)`')
+_CODE_FENCE_LINE_RE = re.compile(r'```[\w]*\n')
+_EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+
+
 def convert_markdown_to_plain_text(content: str) -> str:
     """
     Convert Markdown formatted text to plain text.
@@ -191,7 +204,8 @@ def convert_markdown_to_plain_text(content: str) -> str:
 
     # Remove Markdown headings
     # ## 一、标题 -> 一、标题
-    result = re.sub(r'^#{1,6}\s*', '', result, flags=re.MULTILINE)
+    if '#' in result:
+        result = _HEADING_RE.sub('', result)
 
     # Convert bullet lists to sentences
     # - 项目1 -> 项目1。
@@ -200,7 +214,7 @@ def convert_markdown_to_plain_text(content: str) -> str:
     bullet_items = []
 
     for line in lines:
-        bullet_match = re.match(r'^[\s]*[-*•○]\s*(.+)$', line)
+        bullet_match = _BULLET_LINE_RE.match(line)
         if bullet_match:
             bullet_items.append(bullet_match.group(1).strip())
         else:
@@ -218,25 +232,31 @@ def convert_markdown_to_plain_text(content: str) -> str:
 
     result = '\n'.join(converted_lines)
 
-    # Remove bold syntax (handle edge cases)
-    result = re.sub(r'\*\*([^*]+)\*\*', r'\1', result)
-    # Handle incomplete bold markers
-    result = re.sub(r'\*\*([^*]+)$', r'\1', result, flags=re.MULTILINE)
-    result = re.sub(r'^([^*]+)\*\*', r'\1', result, flags=re.MULTILINE)
+    # The passes below are order-dependent (each rescans the previous output),
+    # so they stay separate; a pass is skipped when its marker is absent.
+    if '*' in result:
+        # Remove bold syntax (handle edge cases)
+        result = _BOLD_RE.sub(r'\1', result)
+        # Handle incomplete bold markers
+        result = _BOLD_OPEN_RE.sub(r'\1', result)
+        result = _BOLD_CLOSE_RE.sub(r'\1', result)
 
-    # Remove italic syntax
-    result = re.sub(r'(?<!\*)\*([^*]+)\*(?!\*)', r'\1', result)
-    result = re.sub(r'_([^_]+)_', r'\1', result)
+        # Remove italic syntax
+        result = _STAR_ITALIC_RE.sub(r'\1', result)
+    if '_' in result:
+        result = _UNDERSCORE_ITALIC_RE.sub(r'\1', result)
 
-    # Remove inline code
-    result = re.sub(r'`([^`]+)`', r'\1', result)
+    if '`' in result:
+        # Remove inline code
+        result = _INLINE_CODE_RE.sub(r'\1', result)
 
-    # Remove code blocks
-    result = re.sub(r'```[\w]*\n', '', result)
-    result = re.sub(r'```', '', result)
+        # Remove code blocks
+        result = _CODE_FENCE_LINE_RE.sub('', result)
+        result = result.replace('```', '')
 
     # Clean up multiple newlines
-    result = re.sub(r'\n{3,}', '\n\n', result)
+    if '\n\n\n' in result:
+        result = _EXTRA_NEWLINES_RE.sub('\n\n', result)
 
     return result.strip()
 
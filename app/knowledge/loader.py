@@ -19,6 +19,11 @@ from app.knowledge.schemas import KnowledgeItem, ModuleConfig, LPRRate, LPRData
 logger = logging.getLogger(__name__)
 
 
+def _value_density(item: KnowledgeItem) -> float:
+    """Value per token used for budget packing; priority 1 is worth the most."""
+    return 1.0 / (max(item.priority, 1) * max(item.token_estimate, 1))
+
+
 class KnowledgeCache:
     """
     Knowledge cache with LRU eviction and TTL expiration.
@@ -301,15 +306,14 @@ class KnowledgeManager:
         Returns:
             List of KnowledgeItem sorted by priority
         """
-        knowledge_items = []
-        total_tokens = 0
-
         # Default categories to load
         if categories is None:
             categories = ['foundations', 'calculations', 'fact_checking', 'analysis', 'report']
             if include_advanced:
                 categories.append('legal_standards')
 
+        # Collect applicable candidates (category order, then priority order)
+        candidates = []
         for category in categories:
             if category not in self._registry:
                 continue
@@ -335,16 +339,37 @@ class KnowledgeManager:
                 if not knowledge.applies_to_stage(stage):
                     continue
 
-                # Check token budget
-                if total_tokens + knowledge.token_estimate > token_budget:
-                    logger.debug(
-                        f"Token budget ({token_budget}) reached at {total_tokens}. "
-                        f"Skipping: {knowledge_id}"
-                    )
-                    continue
+                candidates.append(knowledge)
 
-                knowledge_items.append(knowledge)
-                total_tokens += knowledge.token_estimate
+        knowledge_items = []
+        selected = set()
+        total_tokens = 0
+
+        def select(knowledge: KnowledgeItem) -> bool:
+            nonlocal total_tokens
+            if total_tokens + knowledge.token_estimate > token_budget:
+                return False
+            knowledge_items.append(knowledge)
+            selected.add((knowledge.category, knowledge.id))
+            total_tokens += knowledge.token_estimate
+            return True
+
+        # Coverage pass: the highest-priority item of each category that fits
+        covered = set()
+        for knowledge in candidates:
+            if knowledge.category not in covered and select(knowledge):
+                covered.add(knowledge.category)
+
+        # Fill the rest of the budget greedily by value per token
+        # (stable: ties keep the category and priority order above)
+        for knowledge in sorted(candidates, key=_value_density, reverse=True):
+            if (knowledge.category, knowledge.id) in selected:
+                continue
+            if not select(knowledge):
+                logger.debug(
+                    f"Token budget ({token_budget}) reached at {total_tokens}. "
+                    f"Skipping: {knowledge.id}"
+                )
 
         # Sort by priority
         return sorted(knowledge_items, key=lambda x: x.priority)
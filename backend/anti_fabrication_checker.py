@@ -22,6 +22,7 @@ Date: 2025-11-06
 
 import re
 import sys
+import json
 import argparse
 from pathlib import Path
 from typing import List, Dict, Tuple
@@ -145,10 +146,15 @@ class AntiFabricationChecker:
                         recommendation=reason
                     ))
 
+    def _has_gap_marker(self, line: str) -> bool:
+        """Check if line contains an acceptable gap marker"""
+        # All gap markers are bracketed, so skip the regex scan without a '['
+        return '[' in line and any(re.search(marker, line) for marker in self.gap_markers)
+
     def _check_citations(self, line_num: int, line: str):
         """Check for proper evidence citations"""
         # Skip lines that are gap markers (these don't need citations)
-        if any(re.search(marker, line) for marker in self.gap_markers):
+        if self._has_gap_marker(line):
             return
 
         # Skip lines that don't make factual claims
@@ -169,9 +175,7 @@ class AntiFabricationChecker:
         if has_factual_claim:
             # Check if line has proper citation
             has_citation = re.search(self.citation_patterns['required'], line)
-            has_gap_marker = any(re.search(marker, line) for marker in self.gap_markers)
-
-            if not has_citation and not has_gap_marker:
+            if not has_citation:
                 # Check if it's a legal reasoning (has law citation)
                 has_law_citation = re.search(r'依据《.*》第\d+条', line)
                 if not has_law_citation:
@@ -191,10 +195,14 @@ class AntiFabricationChecker:
         if self.report_type == 'review-opinion' and '[债权人名称]' in line and line_num <= 5:
             return  # Allow in title section
 
+        # All placeholders are bracketed, so lines without '[' cannot match
+        if '[' not in line:
+            return
+
         for placeholder in self.placeholders:
             if re.search(placeholder, line):
                 # Distinguish from gap markers
-                if not any(re.search(marker, line) for marker in self.gap_markers):
+                if not self._has_gap_marker(line):
                     self.violations.append(Violation(
                         line_num=line_num,
                         severity='CRITICAL',
@@ -214,8 +222,17 @@ class AntiFabricationChecker:
         ]
 
         for line_num, line in enumerate(lines, 1):
-            for pattern, markdown_type, recommendation in prohibited_markdown:
-                if re.search(pattern, line):
+            # Cheap gates per pattern: each regex needs its literal anchor
+            # character, so most plain-text lines skip all four regex scans
+            first_char = line.lstrip()[:1]
+            gates = (
+                line.startswith('#'),
+                first_char != '' and first_char in '-*•○',
+                '**' in line,
+                '|' in line,
+            )
+            for gate, (pattern, markdown_type, recommendation) in zip(gates, prohibited_markdown):
+                if gate and re.search(pattern, line):
                     self.violations.append(Violation(
                         line_num=line_num,
                         severity='CRITICAL',
@@ -345,6 +362,40 @@ def format_report(result: Dict) -> str:
     return "\n".join(lines)
 
 
+def run_stdin_loop(stdin=None, stdout=None):
+    """Serve check requests line by line so one process can check a whole batch
+
+    Each request is a JSON line ``{"path": ..., "type": ...}``; each response is
+    one JSON line with the ``passed`` flag and ``statistics``.
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    checkers: Dict[str, AntiFabricationChecker] = {}
+
+    for line in stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            report_type = request.get('type', 'fact-checking')
+            checker = checkers.get(report_type)
+            if checker is None:
+                checker = checkers[report_type] = AntiFabricationChecker(report_type=report_type)
+            result = checker.check_file(request['path'])
+            if 'error' in result:
+                response = {'error': result['error']}
+            else:
+                response = {
+                    'passed': result['passed'],
+                    'statistics': result['statistics']
+                }
+        except Exception as e:
+            response = {'error': f'Invalid request: {e}'}
+
+        stdout.write(json.dumps(response, ensure_ascii=False) + '\n')
+        stdout.flush()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Anti-Fabrication Checker for Debt Review Reports',
@@ -364,10 +415,14 @@ Report Types:
   fact-checking   事实核查报告
   debt-analysis   债权分析报告
   review-opinion  审查意见表
+
+Batch mode:
+  # Read {"path": ..., "type": ...} JSON lines from stdin, answer one JSON line each
+  python anti_fabrication_checker.py --stdin-loop
         """
     )
 
-    parser.add_argument('file', help='Path to report file to check')
+    parser.add_argument('file', nargs='?', help='Path to report file to check')
     parser.add_argument(
         '--report-type',
         choices=['fact-checking', 'debt-analysis', 'review-opinion'],
@@ -383,9 +438,20 @@ Report Types:
         action='store_true',
         help='Exit with error code if violations found'
     )
+    parser.add_argument(
+        '--stdin-loop',
+        action='store_true',
+        help='Serve JSON-line check requests from stdin until EOF'
+    )
 
     args = parser.parse_args()
 
+    if args.stdin_loop:
+        run_stdin_loop()
+        sys.exit(0)
+    if not args.file:
+        parser.error('the following arguments are required: file')
+
     # Run checker
     checker = AntiFabricationChecker(report_type=args.report_type)
     result = checker.check_file(args.file)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+计算器CLI JSON快速路径验证测试
+
+验证内容：
+1. 快速路径构建的参数与argparse路径解析出的参数完全一致
+2. JSON参数只填充未提供（值为None）的参数
+3. 顶层不是对象的JSON输入按常规错误退出
+"""
+
+import unittest
+import tempfile
+import shutil
+import json
+from pathlib import Path
+import sys
+
+# 添加项目根目录到路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from universal_debt_calculator_cli import (
+    JSON_INPUT_ARG_DEFAULTS,
+    build_args_from_json,
+    load_json_input,
+    merge_json_into_args,
+    parse_cli_args,
+)
+
+
+class TestCliJsonFastPath(unittest.TestCase):
+    """JSON快速路径与argparse路径一致性测试"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.test_dir = tempfile.mkdtemp(prefix="debt_review_test_cli_")
+
+    def tearDown(self):
+        """测试后清理"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _write_json(self, data) -> str:
+        path = Path(self.test_dir) / "input.json"
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        return str(path)
+
+    def test_01_defaults_match_argparse(self):
+        """测试1: 各子命令的快速路径默认值与argparse默认值一致"""
+        json_file = self._write_json({})
+        for command in JSON_INPUT_ARG_DEFAULTS:
+            with self.subTest(command=command):
+                expected = vars(parse_cli_args([command, '--json-input', json_file]))
+                actual = vars(build_args_from_json(command, json_file))
+                self.assertEqual(actual, expected)
+
+    def test_02_json_values_match_argparse(self):
+        """测试2: 合并JSON参数后两条路径结果一致"""
+        json_file = self._write_json({
+            "principal": 100000,
+            "start-date": "2024-01-01",
+            "end_date": "2024-12-31",
+            "rate": 4.35,
+            "base_days": 365,
+        })
+        # argparse路径在run_command中合并JSON
+        expected = parse_cli_args(['simple', '--json-input', json_file])
+        merge_json_into_args(expected, load_json_input(json_file))
+
+        actual = build_args_from_json('simple', json_file)
+        self.assertEqual(vars(actual), vars(expected))
+        # base_days已有argparse默认值，不被JSON覆盖
+        self.assertEqual(actual.base_days, 360)
+
+    def test_03_non_object_json_exits(self):
+        """测试3: 顶层不是对象的JSON输入以退出码1结束，而非抛出异常"""
+        for data in ([], "x", 1):
+            with self.subTest(data=data):
+                json_file = self._write_json(data)
+                with self.assertRaises(SystemExit) as ctx:
+                    build_args_from_json('simple', json_file)
+                self.assertEqual(ctx.exception.code, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
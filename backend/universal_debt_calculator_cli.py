@@ -11,6 +11,7 @@ import argparse
 import re
 import csv
 import os
+from types import SimpleNamespace
 from datetime import datetime, timedelta
 from decimal import Decimal, ROUND_HALF_UP, getcontext
 from typing import Dict, List, Tuple, Optional, Union
@@ -1009,10 +1010,10 @@ def print_compound_result_table(result: Dict):
 
 
 def load_json_input(json_file: str) -> Dict:
-    """从JSON文件加载输入参数"""
+    """从JSON文件加载输入参数（顶层必须是对象）"""
     try:
         with open(json_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            data = json.load(f)
     except FileNotFoundError:
         print(f"❌ 错误: JSON输入文件不存在: {json_file}")
         sys.exit(1)
@@ -1023,6 +1024,11 @@ def load_json_input(json_file: str) -> Dict:
         print(f"❌ 错误: 无法读取JSON文件: {e}")
         sys.exit(1)
 
+    if not isinstance(data, dict):
+        print(f"❌ 错误: JSON输入必须是对象（键值对），实际为 {type(data).__name__}: {json_file}")
+        sys.exit(1)
+    return data
+
 
 def save_json_output(result: Dict, json_file: str = None):
     """保存结果到JSON文件"""
@@ -1554,8 +1560,67 @@ def apply_scenario_to_base_days(args, base_days_explicitly_set=False):
         print(f"ℹ️  根据场景'{scenario_name}'自动设置基准天数为 {scenario_base_days} 天（金融惯例）")
 
 
+# 各子命令的argparse默认值（JSON快速路径下用于补齐未提供的参数）
+# 须与parse_cli_args()中子命令的定义保持一致，由tests/test_cli_json_fast_path.py校验
+_COMMON_ARG_DEFAULTS = {
+    'principal': None,
+    'start_date': None,
+    'end_date': None,
+    'json_output': None,
+    'csv_output': None,
+    'excel_output': None,
+    'sheet_name': None,
+    'debtor': None,
+    'append': False,
+}
+
+JSON_INPUT_ARG_DEFAULTS = {
+    'simple': {'rate': None, 'daily_rate': None, 'base_days': 360, 'scenario': None},
+    'lpr': {'multiplier': 1.0, 'term': '1年期', 'base_days': 360, 'scenario': None},
+    'delay': {},
+    'compound': {'rate': None, 'cycle': None, 'base_days': 360, 'scenario': None,
+                 'initial_interest': 0.0},
+}
+
+
+def build_args_from_json(command: str, json_file: str) -> SimpleNamespace:
+    """
+    JSON快速路径：`<command> --json-input <file>` 形式调用时跳过argparse
+
+    以子命令默认值为底，按与argparse路径相同的规则（仅填充值为None的参数）叠加JSON参数。
+    """
+    args = SimpleNamespace(command=command, json_input=json_file,
+                           **_COMMON_ARG_DEFAULTS, **JSON_INPUT_ARG_DEFAULTS[command])
+    merge_json_into_args(args, load_json_input(json_file))
+    return args
+
+
+def merge_json_into_args(args, input_data: Dict):
+    """将JSON参数合并到args中：仅填充未提供（值为None）的参数"""
+    arg_dict = vars(args)
+    for key, value in input_data.items():
+        attr = key.replace('-', '_') if '-' in key else key
+        if arg_dict.get(attr) is None:
+            arg_dict[attr] = value
+
+
 def main():
     """主函数"""
+    # JSON快速路径：JSON已包含全部参数，无需构建argparse解析器
+    json_fast_path = (len(sys.argv) == 4 and sys.argv[2] == '--json-input'
+                      and sys.argv[1] in JSON_INPUT_ARG_DEFAULTS)
+    if json_fast_path:
+        args = build_args_from_json(sys.argv[1], sys.argv[3])
+    else:
+        args = parse_cli_args()
+        if args is None:
+            return
+
+    run_command(args, json_fast_path)
+
+
+def parse_cli_args(argv: Optional[List[str]] = None):
+    """构建argparse解析器并解析命令行参数（默认取sys.argv）；无子命令时打印帮助并返回None"""
     parser = argparse.ArgumentParser(
         description='通用债权利息计算器 - CLI版本',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1684,28 +1749,32 @@ def main():
     # 全局选项
     parser.add_argument('--version', action='version', version='通用债权利息计算器 CLI v1.0')
     
+    if argv is None:
+        argv = sys.argv[1:]
+
     # 如果没有参数，显示帮助信息
-    if len(sys.argv) == 1:
+    if not argv:
         parser.print_help()
-        return
+        return None
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
-        return
-    
+        return None
+
+    return args
+
+
+def run_command(args, json_already_applied: bool = False):
+    """执行计算并输出结果"""
     # 创建计算器实例
     calculator = UniversalDebtCalculatorCLI()
     
     try:
-        # 处理JSON输入
-        if hasattr(args, 'json_input') and args.json_input:
-            input_data = load_json_input(args.json_input)
-            # 将JSON参数合并到args中
-            for key, value in input_data.items():
-                if not hasattr(args, key.replace('-', '_')) or getattr(args, key.replace('-', '_')) is None:
-                    setattr(args, key.replace('-', '_'), value)
+        # 处理JSON输入（快速路径已在构建参数时合并）
+        if not json_already_applied and hasattr(args, 'json_input') and args.json_input:
+            merge_json_into_args(args, load_json_input(args.json_input))
         
         # 执行相应的计算
         result = None
@@ -20,55 +20,299 @@ v2.0新增功能：
 import os
 import sys
 import json
-import argparse
+import mmap
+import stat
+import atexit
+import copy
+import hashlib
+import threading
+import subprocess
 import configparser
 import re
+import weakref
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+# 债权人目录下的标准子目录
+CREDITOR_SUBDIRS = ("工作底稿", "最终报告", "计算文件", "并行处理prompts")
+_REQUIRED_SUBDIRS = frozenset(CREDITOR_SUBDIRS)
+
+# 已解析的项目配置缓存：配置文件路径 -> (mtime_ns, ConfigParser, 项目信息)
+# 同一进程内多次实例化控制器时避免重复解析INI文件；文件修改后mtime变化，重新解析并替换该路径的条目
+_CONFIG_CACHE: Dict[str, Tuple[int, configparser.ConfigParser, Dict[str, str]]] = {}
+
+
+def _extract_project_fields(config: configparser.ConfigParser) -> Dict[str, str]:
+    """提取生成处理配置时需要的项目信息（每份解析结果只查询一次）"""
+    return {
+        "bankruptcy_date": config.get("关键日期", "破产受理日期", fallback=""),
+        "interest_stop_date": config.get("关键日期", "停止计息日期", fallback=""),
+        "debtor_name": config.get("项目基本信息", "债务人名称", fallback="")
+    }
+
+
+# 最终报告格式检查：标题、bullet列表、粗体三类违规合并为一个正则，单次扫描
+_RE_FORMAT_VIOLATIONS = re.compile(r'(^##\s)|(^- )|(\*\*)', re.MULTILINE)
+_FORMAT_VIOLATION_MESSAGES = (
+    "最终报告包含Markdown标题语法（##），违反格式要求",
+    "最终报告包含bullet列表语法（-），违反格式要求",
+    "最终报告包含粗体语法（**），违反格式要求",
+)
+
+
+@lru_cache(maxsize=4096)
+def _check_report_format(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """读取并检查最终报告格式（按路径、mtime和大小缓存，文件修改后自动失效）"""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    # 单次遍历，三类违规都已发现时提前结束
+    seen = [False, False, False]
+    remaining = 3
+    for m in _RE_FORMAT_VIOLATIONS.finditer(content):
+        idx = m.lastindex - 1
+        if not seen[idx]:
+            seen[idx] = True
+            remaining -= 1
+            if not remaining:
+                break
+
+    return tuple(msg for msg, hit in zip(_FORMAT_VIOLATION_MESSAGES, seen) if hit)
+
+
+# "无计算项"判定关键词（债权分析报告中出现任一即可自动生成说明文件）
+NO_CALC_KEYWORDS = (
+    '未申报利息',
+    '未主张利息',
+    '就低原则',
+    '无需计算',
+    '无利息约定',
+    '无利息条款',
+    '放弃利息',
+    '不计算利息',
+    '无计息约定'
+)
+# 按UTF-8字节匹配，可直接在mmap视图上搜索而无需解码整个文件
+_RE_NO_CALC_KEYWORDS = re.compile(b'|'.join(re.escape(kw.encode('utf-8')) for kw in NO_CALC_KEYWORDS))
+
+
+def _find_no_calc_keyword(report_path: str) -> Optional[str]:
+    """查找债权分析报告中最先出现的"无计算项"关键词，未找到返回None
+
+    小文件直接读取；较大文件mmap后就地搜索，命中即停止，只触及匹配位置之前的页面。
+    """
+    with open(report_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < 4096:
+            match = _RE_NO_CALC_KEYWORDS.search(f.read())
+            return match.group(0).decode('utf-8') if match else None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            match = _RE_NO_CALC_KEYWORDS.search(mm)
+            keyword = match.group(0).decode('utf-8') if match else None
+            del match  # 释放对mmap缓冲区的引用，否则无法关闭mmap
+    return keyword
+
+
+# 各输出文件所在目录（对应config["paths"]中的键）
+_FILE_TEMPLATE_DIRS = {
+    "fact_check_report": "work_papers",
+    "analysis_report": "work_papers",
+    "final_review": "final_reports",
+    "file_inventory": "base_directory",
+    "claim_structure_overview": "work_papers",
+    "legal_relationship_diagram": "work_papers"
+}
+
+
+# 标准输出文件名后缀（债权人名称 + 后缀）
+SUFFIX_FACT_CHECK = "_事实核查报告.md"
+SUFFIX_ANALYSIS = "_债权分析报告.md"
+SUFFIX_OVERVIEW = "_债权结构概览.md"
+SUFFIX_DIAGRAM = "_法律关系图.md"
+SUFFIX_NO_CALC_EXPLANATION = "_无计算项说明.txt"
+
+
+def _build_file_templates(creditor_name: str, processing_date: str) -> Dict[str, str]:
+    """生成债权人各输出文件的标准文件名"""
+    return {
+        "fact_check_report": creditor_name + SUFFIX_FACT_CHECK,
+        "analysis_report": creditor_name + SUFFIX_ANALYSIS,
+        "final_review": f"GY2025_{creditor_name}_债权审查报告_{processing_date}.md",
+        "file_inventory": "文件清单.md",
+        # Phase 8.1: 预处理输出文件模板
+        "claim_structure_overview": creditor_name + SUFFIX_OVERVIEW,
+        "legal_relationship_diagram": creditor_name + SUFFIX_DIAGRAM
+    }
+
+
+def _expected_file_path(config: Dict, key: str) -> str:
+    """获取处理配置中某个输出文件的完整路径
+
+    优先使用生成配置时预先拼好的file_paths；旧配置文件无该字段时按file_templates拼接。
+    """
+    file_paths = config.get("file_paths")
+    if file_paths and key in file_paths:
+        return file_paths[key]
+
+    file_name = config["file_templates"].get(key)
+    if file_name is None:
+        info = config["creditor_info"]
+        file_name = _build_file_templates(info["creditor_name"], info["processing_date"])[key]
+    return os.path.join(config["paths"][_FILE_TEMPLATE_DIRS[key]], file_name)
+
+
+# 标准债权人目录名："编号-名称"
+_CREDITOR_DIR_RE = re.compile(r'^\d+-')
+
+# 反编造验证结果缓存容量（按报告内容哈希，超出后淘汰最久未使用的条目）
+_ANTI_FABRICATION_CACHE_SIZE = 128
+
+# 批量验证同时运行的验证子进程数上限
+_SUBPROCESS_CHECK_MAX_WORKERS = 32
+
+# 批量验证时并发探测债权人目录（读取配置、列出报告）的线程数上限
+_FS_PROBE_MAX_WORKERS = 32
+
+# 单个报告的验证超时（秒）
+_ANTI_FABRICATION_TIMEOUT = 30
+
+# 按(路径, mtime, 大小)记录的反编造验证结果，跨进程持久化于此文件
+# 可通过XDG_CACHE_HOME或构造参数afc_cache_file改变位置
+_ANTI_FABRICATION_CACHE_FILE_NAME = "afc_cache.json"
+
+
+def _default_anti_fabrication_cache_file() -> Path:
+    """持久化缓存的默认位置：$XDG_CACHE_HOME/debt_review/afc_cache.json（未设置时为~/.cache）"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "debt_review" / _ANTI_FABRICATION_CACHE_FILE_NAME
+
+
+# 存活的控制器实例（弱引用，不阻止实例被回收）；进程退出时统一持久化缓存并结束验证进程
+_live_controllers: "weakref.WeakSet[DebtProcessingController]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_controllers():
+    for controller in list(_live_controllers):
+        controller.close()
+
+
+def _list_file_names(directory: str, ordered: bool = False):
+    """单次scandir列出目录下的文件名（目录不存在时为空）
+
+    ordered=False返回set供成员判断；ordered=True按目录遍历顺序返回list。
+    """
+    try:
+        with os.scandir(directory) as it:
+            names = [e.name for e in it if e.is_file()]
+    except FileNotFoundError:
+        names = []
+    return names if ordered else set(names)
+
+
+def _file_size(path: str) -> Optional[int]:
+    """单次stat同时获取文件存在性和大小，文件不存在时返回None"""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
+
 class DebtProcessingController:
     """债权处理工作流控制器"""
     
-    def __init__(self, project_root: str = "/root/debt_review_skills"):
+    def __init__(self, project_root: str = "/root/debt_review_skills",
+                 afc_cache_file: Optional[str] = None):
         self.project_root = Path(project_root)
         self.output_root = self.project_root / "输出"
         self.config_file = self.project_root / "project_config.ini"
+        self.checker_script = self.project_root / "anti_fabrication_checker.py"
         
-        # 加载项目配置
-        self.config = self._load_project_config()
+        # 加载项目配置，以及每个债权人复用的项目信息
+        self.config, self._project_config_cached = self._load_project_config()
+
+        # 债权人处理配置缓存：配置文件路径 -> (mtime_ns, 配置字典)
+        self._config_cache: Dict[str, Tuple[int, Dict]] = {}
+
+        # 反编造验证结果缓存：(报告内容哈希, 报告类型) -> 验证结果
+        # 批量验证在线程池中运行，读写缓存需加锁
+        self._afc_cache: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+        self._afc_cache_lock = threading.Lock()
+
+        # 报告文件状态缓存：(报告路径, 报告类型) -> (mtime_ns, 大小, 验证结果)
+        # 文件未改动时连读取和哈希都可省去；首次使用时从磁盘加载，close()时写回
+        # 与_afc_cache同样按LRU限制容量
+        self._afc_stat_cache: "Optional[OrderedDict[Tuple[str, str], Tuple[int, int, Dict]]]" = None
+        self._afc_stat_cache_dirty = False
+        self._afc_cache_file = (Path(afc_cache_file) if afc_cache_file
+                                else _default_anti_fabrication_cache_file())
+        self._checker_digest: Optional[str] = None
+
+        # 常驻验证子进程（--stdin-loop模式）
+        # 空闲进程放回列表复用，整批验证只需启动一次解释器
+        self._idle_checker_workers: List[subprocess.Popen] = []
+        self._checker_workers_lock = threading.Lock()
+
+        _live_controllers.add(self)
         
-    def _load_project_config(self) -> configparser.ConfigParser:
-        """加载项目配置文件"""
-        config = configparser.ConfigParser()
-        if self.config_file.exists():
-            config.read(self.config_file, encoding='utf-8')
-        else:
+    def _load_project_config(self) -> Tuple[configparser.ConfigParser, Dict[str, str]]:
+        """加载项目配置文件及其中的项目信息（按路径缓存解析结果，返回副本）"""
+        config_path = str(self.config_file)
+        try:
+            st = os.stat(config_path)
+        except FileNotFoundError:
             print(f"⚠️  警告：项目配置文件不存在 {self.config_file}")
-        return config
+            config = configparser.ConfigParser()
+            return config, _extract_project_fields(config)
+
+        cached = _CONFIG_CACHE.get(config_path)
+        if cached is None or cached[0] != st.st_mtime_ns:
+            config = configparser.ConfigParser()
+            config.read(config_path, encoding='utf-8')
+            cached = (st.st_mtime_ns, config, _extract_project_fields(config))
+            _CONFIG_CACHE[config_path] = cached
+        # 各实例拿到独立的副本，修改配置不会影响缓存和其他实例
+        _, config, fields = cached
+        return copy.deepcopy(config), dict(fields)
     
     def create_creditor_directory(self, batch_number: str, creditor_number: str, 
-                                creditor_name: str) -> Path:
-        """创建债权人标准目录结构
+                                creditor_name: str, verbose: bool = True) -> Path:
+        """创建债权人标准目录结构（已存在的子目录不再重复创建）
         
         Args:
             batch_number: 批次号（如：1）
             creditor_number: 债权人编号（如：115）
             creditor_name: 债权人名称（如：慈溪市东航建筑起重机械安装队）
+            verbose: 是否逐个打印子目录（批量初始化时可关闭）
             
         Returns:
             Path: 债权人基础目录路径
         """
         # 构建目录路径
         base_dir = self.output_root / f"第{batch_number}批债权" / f"{creditor_number}-{creditor_name}"
-        
-        # 创建标准子目录
-        subdirs = ["工作底稿", "最终报告", "计算文件", "并行处理prompts"]
-        
-        for subdir in subdirs:
-            subdir_path = base_dir / subdir
-            subdir_path.mkdir(parents=True, exist_ok=True)
-            print(f"✓ 创建目录: {subdir_path}")
+        base_str = str(base_dir)
+
+        # 单次scandir获取已存在的子目录，只为缺失的子目录调用mkdir
+        try:
+            with os.scandir(base_str) as it:
+                existing = {e.name for e in it if e.is_dir()}
+        except FileNotFoundError:
+            os.makedirs(base_str, exist_ok=True)
+            existing = set()
+
+        for subdir in CREDITOR_SUBDIRS:
+            subdir_path = os.path.join(base_str, subdir)
+            if subdir not in existing:
+                os.makedirs(subdir_path, exist_ok=True)
+            if verbose:
+                print(f"✓ 创建目录: {subdir_path}")
         
         return base_dir
     
@@ -85,7 +329,18 @@ class DebtProcessingController:
             Dict: 处理配置信息
         """
         base_path = self.output_root / f"第{batch_number}批债权" / f"{creditor_number}-{creditor_name}"
-        current_date = datetime.now().strftime("%Y%m%d")
+        # 同一时间点生成日期和时间戳，避免跨零点时两者不一致
+        now = datetime.now()
+        current_date = now.strftime("%Y%m%d")
+
+        paths = {
+            "base_directory": str(base_path),
+            "work_papers": str(base_path / "工作底稿"),
+            "final_reports": str(base_path / "最终报告"),
+            "calculation_files": str(base_path / "计算文件"),
+            "parallel_prompts": str(base_path / "并行处理prompts")
+        }
+        file_templates = _build_file_templates(creditor_name, current_date)
         
         config = {
             "creditor_info": {
@@ -94,30 +349,17 @@ class DebtProcessingController:
                 "creditor_name": creditor_name,
                 "processing_date": current_date
             },
-            "paths": {
-                "base_directory": str(base_path),
-                "work_papers": str(base_path / "工作底稿"),
-                "final_reports": str(base_path / "最终报告"),
-                "calculation_files": str(base_path / "计算文件"),
-                "parallel_prompts": str(base_path / "并行处理prompts")
-            },
-            "file_templates": {
-                "fact_check_report": f"{creditor_name}_事实核查报告.md",
-                "analysis_report": f"{creditor_name}_债权分析报告.md",
-                "final_review": f"GY2025_{creditor_name}_债权审查报告_{current_date}.md",
-                "file_inventory": "文件清单.md",
-                # Phase 8.1: 预处理输出文件模板
-                "claim_structure_overview": f"{creditor_name}_债权结构概览.md",
-                "legal_relationship_diagram": f"{creditor_name}_法律关系图.md"
-            },
-            "project_config": {
-                "bankruptcy_date": self.config.get("关键日期", "破产受理日期", fallback=""),
-                "interest_stop_date": self.config.get("关键日期", "停止计息日期", fallback=""),
-                "debtor_name": self.config.get("项目基本信息", "债务人名称", fallback="")
+            "paths": paths,
+            "file_templates": file_templates,
+            # 预先拼接好的输出文件完整路径，验证时直接使用
+            "file_paths": {
+                key: os.path.join(paths[dir_key], file_templates[key])
+                for key, dir_key in _FILE_TEMPLATE_DIRS.items()
             },
+            "project_config": dict(self._project_config_cached),
             "processing_metadata": {
                 "initialization": {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now.isoformat(),
                     "material_statistics": {
                         "total_files": 0,
                         "total_size_kb": 0,
@@ -161,8 +403,12 @@ class DebtProcessingController:
         base_path = Path(config["paths"]["base_directory"])
         config_file = base_path / ".processing_config.json"
         
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, ensure_ascii=False, indent=2)
+        if ORJSON_SUPPORT:
+            # orjson一次性序列化为UTF-8字节，输出格式与json.dump(indent=2)一致
+            config_file.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(config_file, 'w', encoding='utf-8') as f:
+                json.dump(config, f, ensure_ascii=False, indent=2)
         
         print(f"✓ 保存处理配置: {config_file}")
         return config_file
@@ -176,16 +422,24 @@ class DebtProcessingController:
         Returns:
             bool: 验证结果
         """
-        required_dirs = ["工作底稿", "最终报告", "计算文件", "并行处理prompts"]
-        
-        for dir_name in required_dirs:
+        # 单次scandir获取已有子目录，与必需子目录做集合比较
+        present_dirs, present_files = set(), set()
+        try:
+            with os.scandir(base_path) as it:
+                for entry in it:
+                    if entry.name in _REQUIRED_SUBDIRS:
+                        (present_dirs if entry.is_dir() else present_files).add(entry.name)
+        except FileNotFoundError:
+            pass
+
+        if present_dirs != _REQUIRED_SUBDIRS:
+            dir_name = next(d for d in CREDITOR_SUBDIRS if d not in present_dirs)
             dir_path = base_path / dir_name
-            if not dir_path.exists():
-                print(f"❌ 缺少目录: {dir_path}")
-                return False
-            elif not dir_path.is_dir():
+            if dir_name in present_files:
                 print(f"❌ 路径不是目录: {dir_path}")
-                return False
+            else:
+                print(f"❌ 缺少目录: {dir_path}")
+            return False
         
         print(f"✓ 目录结构验证通过: {base_path}")
         return True
@@ -199,9 +453,6 @@ class DebtProcessingController:
         Returns:
             Dict: 检查结果
         """
-        base_path = Path(config["paths"]["base_directory"])
-        creditor_name = config["creditor_info"]["creditor_name"]
-        
         check_results = {
             "fact_check_report": False,
             "analysis_report": False,
@@ -211,27 +462,28 @@ class DebtProcessingController:
         }
         
         # 检查事实核查报告
-        fact_check_path = base_path / "工作底稿" / f"{creditor_name}_事实核查报告.md"
-        check_results["fact_check_report"] = fact_check_path.exists()
+        fact_check_path = _expected_file_path(config, "fact_check_report")
+        check_results["fact_check_report"] = os.path.exists(fact_check_path)
         
         # 检查债权分析报告
-        analysis_path = base_path / "工作底稿" / f"{creditor_name}_债权分析报告.md"
-        check_results["analysis_report"] = analysis_path.exists()
+        analysis_path = _expected_file_path(config, "analysis_report")
+        check_results["analysis_report"] = os.path.exists(analysis_path)
         
         # 检查计算文件
-        calc_dir = base_path / "计算文件"
-        if calc_dir.exists():
-            calc_files = [f for f in calc_dir.iterdir() if f.is_file()]
-            check_results["calculation_files"] = [str(f) for f in calc_files]
+        calc_dir = config["paths"]["calculation_files"]
+        try:
+            with os.scandir(calc_dir) as it:
+                check_results["calculation_files"] = [e.path for e in it if e.is_file()]
+        except FileNotFoundError:
+            pass
         
         # 检查最终报告
-        current_date = datetime.now().strftime("%Y%m%d")
-        final_report_path = base_path / "最终报告" / f"GY2025_{creditor_name}_债权审查报告_{current_date}.md"
-        check_results["final_report"] = final_report_path.exists()
+        final_report_path = _expected_file_path(config, "final_review")
+        check_results["final_report"] = os.path.exists(final_report_path)
         
         # 检查文件清单
-        inventory_path = base_path / "文件清单.md"
-        check_results["file_inventory"] = inventory_path.exists()
+        inventory_path = _expected_file_path(config, "file_inventory")
+        check_results["file_inventory"] = os.path.exists(inventory_path)
         
         return check_results
     
@@ -329,20 +581,18 @@ class DebtProcessingController:
             )
             return results
 
-        base_path = Path(config["paths"]["base_directory"])
-        creditor_name = config["creditor_info"]["creditor_name"]
-        work_papers = base_path / "工作底稿"
-
         # 检查1：债权结构概览（必须存在）
-        overview_file = work_papers / f"{creditor_name}_债权结构概览.md"
-        if not overview_file.exists():
+        overview_path = _expected_file_path(config, "claim_structure_overview")
+        overview_name = os.path.basename(overview_path)
+        overview_size = _file_size(overview_path)
+        if overview_size is None:
             results['status'] = 'error'
             results['recommendations'].append(
-                f'缺少债权结构概览文件: {overview_file.name}'
+                f'缺少债权结构概览文件: {overview_name}'
             )
         else:
             results['structure_overview']['exists'] = True
-            results['structure_overview']['size'] = overview_file.stat().st_size
+            results['structure_overview']['size'] = overview_size
             if results['structure_overview']['size'] < 500:
                 if results['status'] != 'error':
                     results['status'] = 'warning'
@@ -355,15 +605,17 @@ class DebtProcessingController:
         results['legal_diagram']['required'] = diagram_required
 
         if diagram_required:
-            diagram_file = work_papers / f"{creditor_name}_法律关系图.md"
-            if not diagram_file.exists():
+            diagram_path = _expected_file_path(config, "legal_relationship_diagram")
+            diagram_name = os.path.basename(diagram_path)
+            diagram_size = _file_size(diagram_path)
+            if diagram_size is None:
                 results['status'] = 'error'
                 results['recommendations'].append(
-                    f'缺少法律关系图文件: {diagram_file.name}（该债权需要生成关系图）'
+                    f'缺少法律关系图文件: {diagram_name}（该债权需要生成关系图）'
                 )
             else:
                 results['legal_diagram']['exists'] = True
-                results['legal_diagram']['size'] = diagram_file.stat().st_size
+                results['legal_diagram']['size'] = diagram_size
 
         return results
 
@@ -388,7 +640,7 @@ class DebtProcessingController:
                 'recommendations': list
             }
         """
-        calc_dir = Path(config['paths']['calculation_files'])
+        calc_dir = config['paths']['calculation_files']
         creditor_name = config['creditor_info']['creditor_name']
 
         results = {
@@ -399,24 +651,46 @@ class DebtProcessingController:
             'recommendations': []
         }
 
-        # 检查目录是否存在
-        if not calc_dir.exists():
+        # 单次scandir遍历目录，按后缀分类（与pathlib的glob('*.xlsx')等一致，包含隐藏文件）
+        has_entries = False
+        xlsx_files, csv_files, txt_files, md_files = [], [], [], []
+        buckets = (('.xlsx', xlsx_files), ('.csv', csv_files), ('.txt', txt_files), ('.md', md_files))
+        try:
+            with os.scandir(calc_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    has_entries = True
+                    for suffix, bucket in buckets:
+                        if name.endswith(suffix):
+                            bucket.append(entry)
+                            break
+        except FileNotFoundError:
+            # 检查目录是否存在
             results['status'] = 'error'
             results['recommendations'].append(f'计算文件目录不存在: {calc_dir}')
             return results
+        except NotADirectoryError:
+            # 路径是文件时按空目录处理（与原glob('*')返回空列表一致）
+            pass
 
         # 检查目录是否为空
-        calc_files = list(calc_dir.glob('*'))
-        if not calc_files:
+        if not has_entries:
             results['status'] = 'error'
             results['missing_excel'] = True
             results['recommendations'].append('计算文件目录为空，需要补充Excel或说明文件')
             return results
 
         # 检查是否有Excel文件
-        excel_files = list(calc_dir.glob('*.xlsx')) + list(calc_dir.glob('*.csv'))
-        txt_files = list(calc_dir.glob('*.txt'))
-        md_files = list(calc_dir.glob('*.md'))
+        excel_files = xlsx_files + csv_files
+        excel_sizes = [(f, f.stat().st_size) for f in excel_files]
+
+        # 快速路径：有Excel文件且大小均正常（最常见的通过情况），无需后续诊断
+        if excel_files and all(size >= 2048 for _, size in excel_sizes):
+            results['has_explanation'] = bool(txt_files or md_files)
+            results['recommendations'].append(
+                f'债权人{creditor_name}有{len(excel_files)}个Excel计算文件'
+            )
+            return results
 
         # 区分正常说明文件和异常MD文件
         normal_explanation_files = [f for f in txt_files if '无计算项' in f.name]
@@ -440,8 +714,7 @@ class DebtProcessingController:
             return results
 
         # 检查Excel文件大小（损坏检测）
-        for excel_file in excel_files:
-            file_size = excel_file.stat().st_size
+        for excel_file, file_size in excel_sizes:
             if file_size < 2048:  # < 2KB
                 results['status'] = 'warning'
                 results['file_size_issues'].append({
@@ -488,42 +761,30 @@ class DebtProcessingController:
                 'file_sizes': dict
             }
         """
-        base_path = Path(config['paths']['base_directory'])
-        creditor_name = config['creditor_info']['creditor_name']
-
         results = {
             'status': 'pass',
             'missing_files': [],
             'file_sizes': {}
         }
 
-        if stage == 1:
-            # 验证事实核查报告
-            fact_report = base_path / "工作底稿" / f"{creditor_name}_事实核查报告.md"
-            if not fact_report.exists():
-                results['status'] = 'error'
-                results['missing_files'].append(str(fact_report))
-            elif fact_report.stat().st_size < 1000:
-                results['status'] = 'warning'
-                results['file_sizes'][str(fact_report)] = fact_report.stat().st_size
-
-        elif stage == 2:
-            # 验证债权分析报告
-            analysis_report = base_path / "工作底稿" / f"{creditor_name}_债权分析报告.md"
-            if not analysis_report.exists():
+        if stage == 1 or stage == 2:
+            # 验证事实核查报告 / 债权分析报告
+            report = _expected_file_path(
+                config, "fact_check_report" if stage == 1 else "analysis_report")
+            size = _file_size(report)
+            if size is None:
                 results['status'] = 'error'
-                results['missing_files'].append(str(analysis_report))
-            elif analysis_report.stat().st_size < 1000:
+                results['missing_files'].append(report)
+            elif size < 1000:
                 results['status'] = 'warning'
-                results['file_sizes'][str(analysis_report)] = analysis_report.stat().st_size
+                results['file_sizes'][report] = size
 
         elif stage == 3:
             # 验证最终报告
-            current_date = datetime.now().strftime("%Y%m%d")
-            final_report = base_path / "最终报告" / f"GY2025_{creditor_name}_债权审查报告_{current_date}.md"
-            if not final_report.exists():
+            final_report = _expected_file_path(config, "final_review")
+            if not os.path.exists(final_report):
                 results['status'] = 'error'
-                results['missing_files'].append(str(final_report))
+                results['missing_files'].append(final_report)
             else:
                 # 验证格式合规性
                 format_errors = self._validate_report_format(final_report)
@@ -533,7 +794,7 @@ class DebtProcessingController:
 
         return results
 
-    def _validate_report_format(self, report_path: Path) -> List[str]:
+    def _validate_report_format(self, report_path: str) -> List[str]:
         """验证最终报告格式合规性（私有方法）
 
         检查项目（CLAUDE.md要求）：
@@ -547,28 +808,11 @@ class DebtProcessingController:
         Returns:
             list: 格式错误列表
         """
-        errors = []
-
         try:
-            with open(report_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # 检查Markdown标题语法
-            if re.search(r'^##\s', content, re.MULTILINE):
-                errors.append("最终报告包含Markdown标题语法（##），违反格式要求")
-
-            # 检查bullet列表
-            if re.search(r'^- ', content, re.MULTILINE):
-                errors.append("最终报告包含bullet列表语法（-），违反格式要求")
-
-            # 检查粗体语法
-            if '**' in content:
-                errors.append("最终报告包含粗体语法（**），违反格式要求")
-
+            st = os.stat(report_path)
+            return list(_check_report_format(str(report_path), st.st_mtime_ns, st.st_size))
         except Exception as e:
-            errors.append(f"读取报告文件失败: {str(e)}")
-
-        return errors
+            return [f"读取报告文件失败: {str(e)}"]
 
     # ==================== Layer 3: 自动修复功能（v2.0新增） ====================
 
@@ -611,31 +855,12 @@ class DebtProcessingController:
             print(f"⚠️  {creditor_name}: 债权分析报告不存在，无法判断原因")
             return False
 
-        with open(analysis_report_path, 'r', encoding='utf-8') as f:
-            report_content = f.read()
-
-        # 判断是否为"无计算项"情况
-        no_calculation_keywords = [
-            '未申报利息',
-            '未主张利息',
-            '就低原则',
-            '无需计算',
-            '无利息约定',
-            '无利息条款',
-            '放弃利息',
-            '不计算利息',
-            '无计息约定'
-        ]
-
-        reason_found = None
-        for keyword in no_calculation_keywords:
-            if keyword in report_content:
-                reason_found = keyword
-                break
+        # 判断是否为"无计算项"情况（单次扫描，取报告中最先出现的关键词）
+        reason_found = _find_no_calc_keyword(analysis_report_path)
 
         if reason_found:
             # 生成说明文件
-            explanation_file = calc_dir / f"{creditor_name}_无计算项说明.txt"
+            explanation_file = calc_dir / (creditor_name + SUFFIX_NO_CALC_EXPLANATION)
             self._generate_explanation_file(
                 explanation_file,
                 creditor_name,
@@ -693,7 +918,7 @@ class DebtProcessingController:
 
 五、特别说明
 
-详细分析请参见《{creditor_name}_债权分析报告.md》相关章节。
+详细分析请参见《{config['file_templates']['analysis_report']}》相关章节。
 
 ===================================================================
 
@@ -701,21 +926,32 @@ class DebtProcessingController:
 生成时间：{current_date}
 """
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(template)
+        # 内容未变化时不重写，保持文件mtime不变（下游按mtime缓存的验证结果继续有效）
+        data = template.encode('utf-8')
+        try:
+            with open(file_path, 'rb') as f:
+                if f.read() == data:
+                    print(f"  文件已是最新: {file_path.name}")
+                    return
+        except FileNotFoundError:
+            pass
+
+        with open(file_path, 'wb') as f:
+            f.write(data)
 
         print(f"  生成文件: {file_path.name}")
 
     # ==================== Layer 4: 批量操作功能（v2.0新增） ====================
 
     def validate_batch_stage(self, batch_number: int, stage: int,
-                            fix: bool = False) -> Dict:
+                            fix: bool = False, verbose: bool = True) -> Dict:
         """批量验证（或修复）指定批次的指定Stage（Layer 4流程控制）
 
         Args:
             batch_number: 批次号
             stage: Stage编号（0=预处理, 1=事实核查, 2=债权分析, 3=报告整理）
             fix: 是否自动修复（默认只验证）
+            verbose: 是否输出逐个债权人的验证结果（关闭时只返回统计结果）
 
         Returns:
             {
@@ -732,8 +968,23 @@ class DebtProcessingController:
             print(f"❌ 批次目录不存在: {batch_dir}")
             return {'total': 0, 'passed': 0, 'failed': 0, 'fixed': 0, 'details': []}
 
-        # 枚举所有债权人目录
-        creditor_dirs = [d for d in batch_dir.iterdir() if d.is_dir()]
+        # 单次scandir枚举债权人目录（DirEntry自带类型信息，无需逐个stat）
+        with os.scandir(batch_dir) as it:
+            creditor_dirs = [e for e in it if e.is_dir()]
+
+        # 读取配置和验证均为I/O密集型且互不依赖，使用线程池并行执行；
+        # 结果仍按目录顺序汇总和打印，自动修复（会写文件）在主线程中顺序执行
+        standard_dirs = [e for e in creditor_dirs if '-' in e.name]
+        outcomes = {}
+        if standard_dirs:
+            from concurrent.futures import ThreadPoolExecutor
+
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(standard_dirs))
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                outcomes = dict(zip(
+                    (e.name for e in standard_dirs),
+                    pool.map(lambda e: self._validate_creditor_stage(e.path, stage), standard_dirs)
+                ))
 
         results = {
             'total': len(creditor_dirs),
@@ -746,19 +997,27 @@ class DebtProcessingController:
         print(f"\n📋 批量验证第{batch_number}批债权 - Stage {stage}")
         print(f"   共{len(creditor_dirs)}个债权人\n")
 
+        # 逐债权人的输出先缓冲，批量写出以减少stdout写调用
+        log_lines: List[str] = []
+        log = log_lines.append if verbose else (lambda msg: None)
+
+        def flush_log():
+            if log_lines:
+                sys.stdout.write('\n'.join(log_lines) + '\n')
+                log_lines.clear()
+
         for creditor_dir in creditor_dirs:
             # 解析债权人编号和名称
             dir_name = creditor_dir.name
             if '-' not in dir_name:
-                print(f"⚠️  跳过非标准目录: {dir_name}")
+                log(f"⚠️  跳过非标准目录: {dir_name}")
                 continue
 
             creditor_number, creditor_name = dir_name.split('-', 1)
+            config, validation = outcomes[dir_name]
 
-            # 读取配置
-            config_file = creditor_dir / '.processing_config.json'
-            if not config_file.exists():
-                print(f"⚠️  {dir_name}: 配置文件缺失")
+            if config is None:
+                log(f"⚠️  {dir_name}: 配置文件缺失")
                 results['failed'] += 1
                 results['details'].append({
                     'creditor': dir_name,
@@ -767,16 +1026,11 @@ class DebtProcessingController:
                 })
                 continue
 
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-
             # 执行验证
             if stage == 0:
                 # Phase 8.4: 预处理阶段验证
-                validation = self.validate_preprocessing_files(config)
-
                 if validation['skipped']:
-                    print(f"⏭️  {dir_name}: 跳过（旧配置，无preprocessing_config）")
+                    log(f"⏭️  {dir_name}: 跳过（旧配置，无preprocessing_config）")
                     results['passed'] += 1  # 旧配置视为通过
                     results['details'].append({
                         'creditor': dir_name,
@@ -784,7 +1038,7 @@ class DebtProcessingController:
                         'message': '旧配置文件，跳过预处理验证'
                     })
                 elif validation['status'] == 'pass':
-                    print(f"✅ {dir_name}: 预处理验证通过")
+                    log(f"✅ {dir_name}: 预处理验证通过")
                     results['passed'] += 1
                     results['details'].append({
                         'creditor': dir_name,
@@ -792,7 +1046,7 @@ class DebtProcessingController:
                         'message': '预处理文件完整'
                     })
                 elif validation['status'] == 'warning':
-                    print(f"⚠️  {dir_name}: 预处理验证警告 - {validation['recommendations']}")
+                    log(f"⚠️  {dir_name}: 预处理验证警告 - {validation['recommendations']}")
                     results['passed'] += 1  # 警告也视为通过
                     results['details'].append({
                         'creditor': dir_name,
@@ -800,7 +1054,7 @@ class DebtProcessingController:
                         'message': ', '.join(validation['recommendations'])
                     })
                 else:
-                    print(f"❌ {dir_name}: 预处理验证失败 - {validation['recommendations']}")
+                    log(f"❌ {dir_name}: 预处理验证失败 - {validation['recommendations']}")
                     results['failed'] += 1
                     results['details'].append({
                         'creditor': dir_name,
@@ -809,10 +1063,8 @@ class DebtProcessingController:
                     })
 
             elif stage == 2:
-                validation = self.validate_calculation_files(config)
-
                 if validation['status'] == 'pass':
-                    print(f"✅ {dir_name}: 验证通过")
+                    log(f"✅ {dir_name}: 验证通过")
                     results['passed'] += 1
                     results['details'].append({
                         'creditor': dir_name,
@@ -820,11 +1072,12 @@ class DebtProcessingController:
                         'message': '验证通过'
                     })
                 else:
-                    print(f"❌ {dir_name}: {validation['recommendations']}")
+                    log(f"❌ {dir_name}: {validation['recommendations']}")
                     results['failed'] += 1
 
                     # 尝试自动修复
                     if fix:
+                        flush_log()  # 自动修复过程会直接打印，先输出已缓冲的内容保持顺序
                         analysis_report = Path(config['paths']['work_papers']) / \
                                         config['file_templates']['analysis_report']
                         if self.auto_fix_missing_calculation_files(config, analysis_report):
@@ -849,9 +1102,9 @@ class DebtProcessingController:
 
             # Stage 1和3的验证逻辑可以后续添加
             elif stage == 1:
-                report_validation = self.validate_report_completeness(config, 1)
+                report_validation = validation
                 if report_validation['status'] == 'pass':
-                    print(f"✅ {dir_name}: Stage 1验证通过")
+                    log(f"✅ {dir_name}: Stage 1验证通过")
                     results['passed'] += 1
                     results['details'].append({
                         'creditor': dir_name,
@@ -859,7 +1112,7 @@ class DebtProcessingController:
                         'message': '事实核查报告完整'
                     })
                 else:
-                    print(f"❌ {dir_name}: Stage 1验证失败")
+                    log(f"❌ {dir_name}: Stage 1验证失败")
                     results['failed'] += 1
                     results['details'].append({
                         'creditor': dir_name,
@@ -868,9 +1121,9 @@ class DebtProcessingController:
                     })
 
             elif stage == 3:
-                report_validation = self.validate_report_completeness(config, 3)
+                report_validation = validation
                 if report_validation['status'] == 'pass':
-                    print(f"✅ {dir_name}: Stage 3验证通过")
+                    log(f"✅ {dir_name}: Stage 3验证通过")
                     results['passed'] += 1
                     results['details'].append({
                         'creditor': dir_name,
@@ -878,7 +1131,7 @@ class DebtProcessingController:
                         'message': '最终报告完整且格式正确'
                     })
                 else:
-                    print(f"❌ {dir_name}: Stage 3验证失败")
+                    log(f"❌ {dir_name}: Stage 3验证失败")
                     results['failed'] += 1
                     error_msg = '最终报告缺失或格式不符'
                     if 'format_errors' in report_validation:
@@ -889,8 +1142,60 @@ class DebtProcessingController:
                         'message': error_msg
                     })
 
+        flush_log()
         return results
 
+    def _validate_creditor_stage(self, creditor_dir: str,
+                                 stage: int) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """读取单个债权人的配置并执行指定Stage的验证（私有辅助方法，供线程池调用）
+
+        Args:
+            creditor_dir: 债权人目录路径
+            stage: Stage编号（0=预处理, 1=事实核查, 2=债权分析, 3=报告整理）
+
+        Returns:
+            Tuple[Optional[Dict], Optional[Dict]]: (配置字典, 验证结果)，配置缺失时均为None
+        """
+        config = self._read_processing_config(creditor_dir)
+        if config is None:
+            return None, None
+
+        if stage == 0:
+            validation = self.validate_preprocessing_files(config)
+        elif stage == 2:
+            validation = self.validate_calculation_files(config)
+        elif stage in (1, 3):
+            validation = self.validate_report_completeness(config, stage)
+        else:
+            validation = None
+        return config, validation
+
+    def _read_processing_config(self, creditor_dir: str) -> Optional[Dict]:
+        """读取债权人目录下的.processing_config.json（私有辅助方法）
+
+        按mtime缓存解析结果，同一批次多次验证时未修改的配置文件不再重复解析。
+
+        Args:
+            creditor_dir: 债权人目录路径
+
+        Returns:
+            Optional[Dict]: 配置字典，文件不存在时返回None
+        """
+        config_path = os.path.join(creditor_dir, '.processing_config.json')
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        cached = self._config_cache.get(config_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        self._config_cache[config_path] = (mtime_ns, config)
+        return config
+
     # ==================== Layer 5: 反编造验证功能（Anti-Fabrication Checking） ====================
 
     def run_anti_fabrication_check(self, report_path: Path, report_type: str) -> Dict:
@@ -908,62 +1213,194 @@ class DebtProcessingController:
                 'report_file': str
             }
         """
-        import subprocess
-
-        if not report_path.exists():
+        # 一次stat同时完成存在性检查和改动检测
+        try:
+            st = os.stat(report_path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             return {
                 'passed': False,
                 'error': f'报告文件不存在: {report_path}'
             }
 
-        checker_script = self.project_root / "anti_fabrication_checker.py"
-        if not checker_script.exists():
+        checker_script = self.checker_script
+        if not os.path.isfile(checker_script):
             return {
                 'passed': False,
                 'error': f'验证工具不存在: {checker_script}'
             }
 
+        # 报告文件mtime和大小均未变时，无需读取文件即可复用上次的验证结果
+        stat_key = (str(report_path), report_type)
+        with self._afc_cache_lock:
+            stat_cache = self._load_anti_fabrication_stat_cache()
+            prev = stat_cache.get(stat_key)
+            if prev is not None:
+                stat_cache.move_to_end(stat_key)
+        if prev is not None and prev[0] == st.st_mtime_ns and prev[1] == st.st_size:
+            # 各缓存保存同一结构的结果，一律返回副本，调用方修改结果不会影响缓存
+            return copy.deepcopy(prev[2])
+
+        # 报告内容未变时直接复用上次的验证结果
         try:
-            # Run anti-fabrication checker
-            result = subprocess.run(
-                ['python3', str(checker_script), str(report_path), '--report-type', report_type],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            digest = hashlib.blake2b(report_path.read_bytes(), digest_size=16).hexdigest()
+        except OSError:
+            digest = None
+        cache_key = (digest, report_type)
+        if digest is not None:
+            with self._afc_cache_lock:
+                cached = self._afc_cache.get(cache_key)
+                if cached is not None:
+                    self._afc_cache.move_to_end(cache_key)
+            if cached is not None:
+                result = copy.deepcopy(cached)
+                result['report_file'] = str(report_path)
+                self._remember_anti_fabrication_stat(stat_key, st, result)
+                return copy.deepcopy(result)
+
+        result = self._execute_anti_fabrication_check(checker_script, report_path, report_type)
+
+        # 仅缓存成功完成的验证（超时、异常等错误下次仍重新验证）
+        if digest is not None and 'error' not in result:
+            with self._afc_cache_lock:
+                self._afc_cache[cache_key] = copy.deepcopy(result)
+                self._afc_cache.move_to_end(cache_key)
+                while len(self._afc_cache) > _ANTI_FABRICATION_CACHE_SIZE:
+                    self._afc_cache.popitem(last=False)
+            self._remember_anti_fabrication_stat(stat_key, st, copy.deepcopy(result))
+        return result
+
+    def _checker_version(self) -> str:
+        """验证工具文件内容的哈希（持久化缓存以此判断验证规则是否变化，调用方需持有锁）"""
+        if self._checker_digest is None:
+            try:
+                self._checker_digest = hashlib.blake2b(
+                    self.checker_script.read_bytes(), digest_size=16).hexdigest()
+            except OSError:
+                self._checker_digest = ""
+        return self._checker_digest
+
+    def _load_anti_fabrication_stat_cache(self) -> Dict[Tuple[str, str], Tuple[int, int, Dict]]:
+        """加载持久化的报告状态缓存（私有辅助方法，调用方需持有锁）
+
+        验证工具修改过或缓存文件损坏时丢弃旧结果。
+        """
+        if self._afc_stat_cache is None:
+            self._afc_stat_cache = OrderedDict()
+            try:
+                with open(self._afc_cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('checker_version') == self._checker_version():
+                    entries = data['entries'][-_ANTI_FABRICATION_CACHE_SIZE:]
+                    for path, report_type, mtime_ns, size, result in entries:
+                        self._afc_stat_cache[(path, report_type)] = (mtime_ns, size, result)
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+        return self._afc_stat_cache
+
+    def _remember_anti_fabrication_stat(self, stat_key: Tuple[str, str],
+                                        st: os.stat_result, result: Dict):
+        """记录报告状态对应的验证结果，超出容量时淘汰最久未使用的条目"""
+        with self._afc_cache_lock:
+            stat_cache = self._load_anti_fabrication_stat_cache()
+            stat_cache[stat_key] = (st.st_mtime_ns, st.st_size, result)
+            stat_cache.move_to_end(stat_key)
+            while len(stat_cache) > _ANTI_FABRICATION_CACHE_SIZE:
+                stat_cache.popitem(last=False)
+            self._afc_stat_cache_dirty = True
+
+    def save_anti_fabrication_cache(self) -> bool:
+        """将报告状态缓存写入持久化缓存文件（默认 $XDG_CACHE_HOME/debt_review/afc_cache.json）
 
-            # Parse output for statistics
-            output = result.stdout
-            passed = '✅ 通过' in output
-
-            # Extract violation counts
-            violations = {'total': 0, 'CRITICAL': 0, 'HIGH': 0, 'MEDIUM': 0, 'LOW': 0}
-
-            # Parse severity counts from output
-            for line in output.split('\n'):
-                if '- CRITICAL (严重):' in line:
-                    violations['CRITICAL'] = int(re.search(r'(\d+)', line).group(1))
-                elif '- HIGH (高):' in line:
-                    violations['HIGH'] = int(re.search(r'(\d+)', line).group(1))
-                elif '- MEDIUM (中):' in line:
-                    violations['MEDIUM'] = int(re.search(r'(\d+)', line).group(1))
-                elif '- LOW (低):' in line:
-                    violations['LOW'] = int(re.search(r'(\d+)', line).group(1))
-                elif '总违规数:' in line:
-                    violations['total'] = int(re.search(r'(\d+)', line).group(1))
+        Returns:
+            bool: 是否写入成功（无新结果时不写入，返回True）
+        """
+        with self._afc_cache_lock:
+            if not self._afc_stat_cache_dirty:
+                return True
+            data = {
+                'checker_version': self._checker_version(),
+                'entries': [[path, report_type, mtime_ns, size, result]
+                            for (path, report_type), (mtime_ns, size, result)
+                            in self._afc_stat_cache.items()]
+            }
+            try:
+                cache_file = self._afc_cache_file
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                # 先写临时文件再替换，避免中断时留下损坏的缓存
+                tmp_path = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp_path, cache_file)
+            except OSError as e:
+                print(f"⚠️  反编造验证缓存保存失败: {e}")
+                return False
+            self._afc_stat_cache_dirty = False
+            return True
+
+    def _execute_anti_fabrication_check(self, checker_script: Path, report_path: Path,
+                                        report_type: str) -> Dict:
+        """实际执行反编造验证（私有辅助方法，不经过结果缓存）"""
+        # 在常驻验证子进程中运行：保留超时保护（异常报告不会卡住整批验证），
+        # 且批量验证时多个子进程可真正并行执行CPU密集的正则检查
+        try:
+            # Reuse a persistent --stdin-loop worker instead of one interpreter per report
+            worker = self._acquire_checker_worker(checker_script)
+            timed_out = threading.Event()
+
+            def kill_on_timeout():
+                timed_out.set()
+                worker.kill()
+
+            timer = threading.Timer(_ANTI_FABRICATION_TIMEOUT, kill_on_timeout)
+            timer.start()
+            try:
+                worker.stdin.write(json.dumps(
+                    {'path': str(report_path), 'type': report_type}, ensure_ascii=False) + '\n')
+                worker.stdin.flush()
+                line = worker.stdout.readline()
+            except (BrokenPipeError, OSError):
+                line = ''
+            finally:
+                timer.cancel()
+
+            if not line:
+                self._discard_checker_worker(worker)
+                # 仅在未读到结果时才按超时处理：定时器可能在readline已返回后才触发
+                if timed_out.is_set():
+                    raise subprocess.TimeoutExpired(worker.args, _ANTI_FABRICATION_TIMEOUT)
+                return {
+                    'passed': False,
+                    'error': '验证失败: 未获取到验证结果'
+                }
+            if timed_out.is_set():
+                # 已读到结果但进程随后被定时器结束，结果照常使用，进程不再复用
+                self._discard_checker_worker(worker)
+            else:
+                self._release_checker_worker(worker)
+
+            response = json.loads(line)
+            if 'error' in response:
+                return {
+                    'passed': False,
+                    'error': f"验证失败: {response['error']}"
+                }
+
+            stats = response['statistics']
+            violations = {'total': stats['total'], **stats['by_severity']}
 
             return {
-                'passed': passed,
+                'passed': response['passed'],
                 'violations': violations['total'],
                 'severity_breakdown': violations,
-                'report_file': str(report_path),
-                'output': output
+                'report_file': str(report_path)
             }
 
         except subprocess.TimeoutExpired:
             return {
                 'passed': False,
-                'error': '验证超时（>30秒）'
+                'error': f'验证超时（>{_ANTI_FABRICATION_TIMEOUT}秒）'
             }
         except Exception as e:
             return {
@@ -971,12 +1408,120 @@ class DebtProcessingController:
                 'error': f'验证失败: {str(e)}'
             }
 
-    def validate_creditor_anti_fabrication(self, config: Dict, stage: int = 3) -> Dict:
+    def _acquire_checker_worker(self, checker_script: Path) -> subprocess.Popen:
+        """取出一个空闲的常驻验证进程，没有时启动新进程（私有辅助方法）"""
+        with self._checker_workers_lock:
+            while self._idle_checker_workers:
+                worker = self._idle_checker_workers.pop()
+                if worker.poll() is None:
+                    return worker
+
+        return subprocess.Popen(
+            ['python3', str(checker_script), '--stdin-loop'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            bufsize=1
+        )
+
+    def _release_checker_worker(self, worker: subprocess.Popen):
+        """将验证进程放回空闲列表（私有辅助方法）"""
+        with self._checker_workers_lock:
+            self._idle_checker_workers.append(worker)
+
+    @staticmethod
+    def _discard_checker_worker(worker: subprocess.Popen):
+        """结束已超时或异常退出的验证进程（私有辅助方法）"""
+        if worker.poll() is None:
+            worker.kill()
+        worker.wait()
+        worker.stdin.close()
+        worker.stdout.close()
+
+    def close_checker_workers(self):
+        """结束所有常驻验证进程（由close()调用）"""
+        with self._checker_workers_lock:
+            workers, self._idle_checker_workers = self._idle_checker_workers, []
+        for worker in workers:
+            try:
+                # 关闭stdin后验证进程读到EOF自行退出
+                worker.stdin.close()
+                worker.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                worker.kill()
+                worker.wait()
+            worker.stdout.close()
+
+    def close(self):
+        """持久化报告状态缓存并结束常驻验证进程
+
+        由with语句或进程退出时的atexit钩子调用，可重复调用。
+        """
+        self.save_anti_fabrication_cache()
+        self.close_checker_workers()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __del__(self):
+        # 回收时可能已处于解释器退出阶段，不写文件也不等待，只尽力结束空闲验证进程
+        for worker in getattr(self, '_idle_checker_workers', ()):
+            try:
+                worker.kill()
+            except Exception:
+                pass
+
+    def _collect_anti_fabrication_checks(self, config: Dict,
+                                         stage: int) -> List[Tuple[str, Path, str]]:
+        """列出单个债权人在指定阶段需要反编造验证的报告（私有辅助方法）
+
+        Args:
+            config: 处理配置字典
+            stage: 验证阶段 (1=事实核查, 2=债权分析, 3=全部)
+
+        Returns:
+            List[Tuple[str, Path, str]]: (报告类型, 报告路径, 显示名称) 列表
+        """
+        checks = []
+
+        # 单次scandir列出工作底稿目录，用名称查找代替逐个exists()
+        work_paper_names = _list_file_names(config['paths']['work_papers'])
+
+        if stage >= 1:
+            fact_check_report = _expected_file_path(config, "fact_check_report")
+            if os.path.basename(fact_check_report) in work_paper_names:
+                checks.append(('fact-checking', Path(fact_check_report), '事实核查报告'))
+
+        if stage >= 2:
+            analysis_report = _expected_file_path(config, "analysis_report")
+            if os.path.basename(analysis_report) in work_paper_names:
+                checks.append(('debt-analysis', Path(analysis_report), '债权分析报告'))
+
+        if stage >= 3:
+            final_dir = config['paths']['final_reports']
+            final_report = next(
+                (name for name in _list_file_names(final_dir, ordered=True)
+                 if name.startswith('GY2025_') and name.endswith('.md')),
+                None
+            )
+            if final_report:
+                checks.append(('review-opinion', Path(final_dir, final_report), '审查意见表'))
+
+        return checks
+
+    def validate_creditor_anti_fabrication(self, config: Dict, stage: int = 3,
+                                           check_results: Optional[Dict[Path, Dict]] = None) -> Dict:
         """对单个债权人的所有报告运行反编造验证
 
         Args:
             config: 处理配置字典
             stage: 验证阶段 (1=事实核查, 2=债权分析, 3=全部)
+            check_results: 已并行完成的验证结果（报告路径 -> 结果），为None时逐个运行验证
 
         Returns:
             {
@@ -989,7 +1534,6 @@ class DebtProcessingController:
             }
         """
         creditor_name = config['creditor_info']['creditor_name']
-        base_path = Path(config['paths']['base_directory'])
 
         results = {
             'creditor': creditor_name,
@@ -1001,63 +1545,60 @@ class DebtProcessingController:
         }
 
         # Define reports to check based on stage
-        checks = []
-
-        if stage >= 1:
-            fact_check_report = base_path / "工作底稿" / f"{creditor_name}_事实核查报告.md"
-            if fact_check_report.exists():
-                checks.append(('fact-checking', fact_check_report, '事实核查报告'))
-
-        if stage >= 2:
-            analysis_report = base_path / "工作底稿" / f"{creditor_name}_债权分析报告.md"
-            if analysis_report.exists():
-                checks.append(('debt-analysis', analysis_report, '债权分析报告'))
+        checks = self._collect_anti_fabrication_checks(config, stage)
 
-        if stage >= 3:
-            final_reports = list((base_path / "最终报告").glob("GY2025_*.md"))
-            if final_reports:
-                checks.append(('review-opinion', final_reports[0], '审查意见表'))
-
-        # Run checks
+        # Run checks (counters kept in locals, written back once after the loop)
+        reports_checked = 0
+        reports_passed = 0
+        total_violations = 0
+        details = []
         for report_type, report_path, display_name in checks:
             print(f"\n  检查 {display_name}: {report_path.name}")
-            check_result = self.run_anti_fabrication_check(report_path, report_type)
+            check_result = check_results.get(report_path) if check_results else None
+            if check_result is None:
+                check_result = self.run_anti_fabrication_check(report_path, report_type)
 
-            results['reports_checked'] += 1
+            reports_checked += 1
 
             if 'error' in check_result:
-                results['details'].append({
+                details.append({
                     'report': display_name,
                     'status': 'error',
                     'message': check_result['error']
                 })
             else:
                 if check_result['passed']:
-                    results['reports_passed'] += 1
+                    reports_passed += 1
                     print(f"    ✅ 通过")
                 else:
                     violations = check_result['violations']
-                    results['total_violations'] += violations
+                    total_violations += violations
                     severity = check_result['severity_breakdown']
                     print(f"    ❌ 检测到 {violations} 处违规")
                     print(f"       严重: {severity['CRITICAL']}, 高: {severity['HIGH']}, "
                           f"中: {severity['MEDIUM']}, 低: {severity['LOW']}")
 
-                results['details'].append({
+                details.append({
                     'report': display_name,
                     'status': 'passed' if check_result['passed'] else 'failed',
                     'violations': check_result['violations'],
                     'severity': check_result['severity_breakdown']
                 })
 
+        results.update(reports_checked=reports_checked, reports_passed=reports_passed,
+                       total_violations=total_violations, details=details)
         return results
 
-    def validate_batch_anti_fabrication(self, batch_number: int, stage: int = 3) -> Dict:
+    def validate_batch_anti_fabrication(self, batch_number: int, stage: int = 3,
+                                        jobs: Optional[int] = None) -> Dict:
         """对整批债权运行反编造验证
 
+        先收集整批需要检查的报告并发执行验证，再按债权人顺序汇总输出。
+
         Args:
             batch_number: 批次号
             stage: 验证阶段 (1=事实核查, 2=债权分析, 3=全部)
+            jobs: 并发验证数（默认CPU核数且不超过32；1表示串行，便于调试）
 
         Returns:
             {
@@ -1083,47 +1624,94 @@ class DebtProcessingController:
             'details': []
         }
 
-        # Find all creditor directories
-        creditor_dirs = [d for d in batch_dir.iterdir() if d.is_dir() and re.match(r'^\d+-', d.name)]
+        # Find all creditor directories (single scandir, DirEntry carries the file type)
+        with os.scandir(batch_dir) as it:
+            creditor_dirs = [e for e in it
+                             if e.is_dir() and _CREDITOR_DIR_RE.match(e.name)]
 
         print(f"\n🔍 批量反编造验证: 第{batch_number}批，阶段{stage}")
         print(f"找到 {len(creditor_dirs)} 个债权人目录")
 
-        for creditor_dir in sorted(creditor_dirs):
-            config_file = creditor_dir / ".processing_config.json"
+        # Load configs and collect all reports to check across the batch
+        creditor_dirs.sort(key=lambda e: e.name)
 
-            if not config_file.exists():
+        def probe_creditor(creditor_dir):
+            # Load config (mtime-cached, shared with validate_batch_stage) and list its reports
+            config = self._read_processing_config(creditor_dir.path)
+            checks = self._collect_anti_fabrication_checks(config, stage) if config is not None else []
+            return config, checks
+
+        if jobs == 1 or len(creditor_dirs) <= 1:
+            probes = [probe_creditor(d) for d in creditor_dirs]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            # Per-creditor stat/open/scandir calls overlap instead of running back to back
+            with ThreadPoolExecutor(max_workers=min(_FS_PROBE_MAX_WORKERS, len(creditor_dirs))) as pool:
+                probes = list(pool.map(probe_creditor, creditor_dirs))
+
+        creditor_configs = []
+        pending_checks = []
+        for creditor_dir, (config, checks) in zip(creditor_dirs, probes):
+            creditor_configs.append((creditor_dir, config))
+            pending_checks.extend(checks)
+
+        # Run checks concurrently
+        check_results = {}
+        if pending_checks:
+            # 每个工作线程驱动一个常驻验证子进程，CPU密集的检查在各子进程中并行
+            max_workers = jobs or min(_SUBPROCESS_CHECK_MAX_WORKERS, os.cpu_count() or 1)
+            if max_workers == 1:
+                check_results = {path: self.run_anti_fabrication_check(path, report_type)
+                                 for report_type, path, _ in pending_checks}
+            else:
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(pending_checks))) as pool:
+                    futures = {path: pool.submit(self.run_anti_fabrication_check, path, report_type)
+                               for report_type, path, _ in pending_checks}
+                    check_results = {path: future.result() for path, future in futures.items()}
+
+        # Per-creditor columns (structure of arrays); details and totals are built once at the end
+        names = []
+        checked = []
+        passed = []
+        viols = []
+        for creditor_dir, config in creditor_configs:
+            if config is None:
                 print(f"\n⚠️  跳过 {creditor_dir.name} (缺少配置文件)")
                 continue
 
-            # Load config
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-
             creditor_name = config['creditor_info']['creditor_name']
             print(f"\n📄 检查: {creditor_name}")
 
-            # Run anti-fabrication checks
-            creditor_result = self.validate_creditor_anti_fabrication(config, stage)
-
-            results['total_creditors'] += 1
-            results['total_violations'] += creditor_result['total_violations']
-
-            if creditor_result['reports_passed'] == creditor_result['reports_checked']:
-                results['creditors_passed'] += 1
-
-            results['details'].append({
-                'creditor': creditor_name,
-                'reports_checked': creditor_result['reports_checked'],
-                'reports_passed': creditor_result['reports_passed'],
-                'violations': creditor_result['total_violations'],
-                'status': 'passed' if creditor_result['reports_passed'] == creditor_result['reports_checked'] else 'failed'
-            })
-
+            # Aggregate anti-fabrication check results
+            creditor_result = self.validate_creditor_anti_fabrication(config, stage, check_results)
+
+            names.append(creditor_name)
+            checked.append(creditor_result['reports_checked'])
+            passed.append(creditor_result['reports_passed'])
+            viols.append(creditor_result['total_violations'])
+
+        results.update(
+            total_creditors=len(names),
+            creditors_passed=sum(p == c for p, c in zip(passed, checked)),
+            total_violations=sum(viols),
+            details=[{
+                'creditor': n,
+                'reports_checked': c,
+                'reports_passed': p,
+                'violations': v,
+                'status': 'passed' if p == c else 'failed'
+            } for n, c, p, v in zip(names, checked, passed, viols)]
+        )
         return results
 
 def main():
     """主函数 - 命令行接口（v2.0增强版）"""
+    # argparse仅命令行使用，作为库导入控制器时无需加载
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='债权处理工作流控制器 v2.0 - 环境管理与质量验证工具',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -10,6 +10,7 @@
 
 import os
 import sys
+import copy
 import json
 from pathlib import Path
 from typing import Dict, Optional, Tuple
@@ -20,6 +21,20 @@ class EnvironmentChecker:
     def __init__(self, project_root: str = "/root/debt_review_solution"):
         self.project_root = Path(project_root)
         self.output_root = self.project_root / "输出"
+        # 检查结果缓存: (基础目录, 目录mtime, 配置文件mtime) -> 检查结果
+        self._env_cache: Dict[Tuple[str, int, int], Dict] = {}
+    
+    def clear_cache(self):
+        """清空环境检查结果缓存"""
+        self._env_cache.clear()
+    
+    @staticmethod
+    def _mtime_ns(path: Path) -> int:
+        """获取路径的mtime（纳秒），不存在时返回0"""
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return 0
     
     def check_creditor_environment(self, batch_number: str, creditor_number: str,
                                  creditor_name: str) -> Dict:
@@ -34,6 +49,13 @@ class EnvironmentChecker:
             Dict: 检查结果
         """
         base_path = self.output_root / f"第{batch_number}批债权" / f"{creditor_number}-{creditor_name}"
+        config_file = base_path / ".processing_config.json"
+        
+        # 目录项增删会更新基础目录的mtime；配置文件原地改写则需单独比较其mtime
+        cache_key = (str(base_path), self._mtime_ns(base_path), self._mtime_ns(config_file))
+        cached = self._env_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
         
         result = {
             "creditor_info": {
@@ -54,15 +76,23 @@ class EnvironmentChecker:
             "recommendations": []
         }
         
+        # 一次扫描基础目录，子目录与配置文件均做集合成员判断
+        try:
+            with os.scandir(base_path) as it:
+                entries = {entry.name: entry.is_dir() for entry in it}
+            base_exists = True
+        except (FileNotFoundError, NotADirectoryError):
+            entries = {}
+            base_exists = False
+        
         # 检查基础目录
-        if base_path.exists() and base_path.is_dir():
+        if base_exists:
             result["environment_status"]["base_directory_exists"] = True
         else:
             result["missing_components"].append("基础目录不存在")
         
         # 检查配置文件
-        config_file = base_path / ".processing_config.json"
-        if config_file.exists():
+        if config_file.name in entries:
             result["environment_status"]["config_file_exists"] = True
             try:
                 with open(config_file, 'r', encoding='utf-8') as f:
@@ -75,8 +105,7 @@ class EnvironmentChecker:
         # 检查子目录
         required_dirs = ["工作底稿", "最终报告", "计算文件"]
         for dir_name in required_dirs:
-            dir_path = base_path / dir_name
-            exists = dir_path.exists() and dir_path.is_dir()
+            exists = entries.get(dir_name, False)
             result["directory_status"][dir_name] = exists
             if not exists:
                 result["missing_components"].append(f"缺少目录: {dir_name}")
@@ -97,6 +126,7 @@ class EnvironmentChecker:
                 f"运行初始化命令: python 债权处理工作流控制器.py {batch_number} {creditor_number} {creditor_name}"
             )
         
+        self._env_cache[cache_key] = copy.deepcopy(result)
         return result
     
     def print_check_result(self, result: Dict):
@@ -5,7 +5,15 @@
 用于核查天津驹丰供应链管理有限公司债权的计息天数计算
 """
 
-from datetime import datetime, timedelta
+from datetime import date
+
+# 各计算方法相对自然天数差的偏移量
+METHOD_OFFSETS = {
+    "exclude_both_ends": -1,  # 不包含起止日
+    "exclude_start": 0,       # 不包含起始日，包含结束日
+    "exclude_end": 0,         # 包含起始日，不包含结束日
+    "include_both_ends": 1,   # 包含起止日
+}
 
 def calculate_days_between(start_date_str, end_date_str, method="exclude_both_ends"):
     """
@@ -23,26 +31,14 @@ def calculate_days_between(start_date_str, end_date_str, method="exclude_both_en
     返回:
         天数（整数）
     """
-    start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
-    end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
+    try:
+        offset = METHOD_OFFSETS[method]
+    except KeyError:
+        raise ValueError(f"未知的计算方法: {method}") from None
 
     # 基础天数差（自然天数差，不含起始日）
-    delta = (end_date - start_date).days
-
-    if method == "exclude_both_ends":
-        # 不包含起止日：delta - 1
-        return delta - 1
-    elif method == "exclude_start":
-        # 不包含起始日，包含结束日：delta
-        return delta
-    elif method == "exclude_end":
-        # 包含起始日，不包含结束日：delta
-        return delta
-    elif method == "include_both_ends":
-        # 包含起止日：delta + 1
-        return delta + 1
-    else:
-        raise ValueError(f"未知的计算方法: {method}")
+    delta = (date.fromisoformat(end_date_str) - date.fromisoformat(start_date_str)).days
+    return delta + offset
 
 
 def main():
@@ -74,9 +70,7 @@ def main():
     print("-" * 70)
 
     # Python timedelta 基础计算（自然天数差）
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
-    natural_days = (end - start).days
+    natural_days = calculate_days_between(start_date, end_date, "exclude_start")
     print(f"\nPython timedelta 自然天数差: {natural_days} 天")
     print("（注：timedelta.days 返回的是不含起始日的天数）")
 
@@ -129,17 +123,17 @@ def main():
     ]
 
     print("\n2022年:")
+    start_day = date.fromisoformat(start_date)
     total_2022 = 0
     for month_name, m_start, m_end in months_2022:
-        m_start_dt = datetime.strptime(m_start, "%Y-%m-%d")
-        m_end_dt = datetime.strptime(m_end, "%Y-%m-%d")
+        m_end_d = date.fromisoformat(m_end)
 
         # 特殊处理2月（起始日为2022-02-15）
         if month_name == "2月":
             # 从2022-02-15到2022-02-28
-            days_in_month = (m_end_dt - datetime.strptime("2022-02-15", "%Y-%m-%d")).days
+            days_in_month = (m_end_d - start_day).days
         else:
-            days_in_month = (m_end_dt - m_start_dt).days + 1
+            days_in_month = (m_end_d - date.fromisoformat(m_start)).days + 1
 
         total_2022 += days_in_month
         print(f"  {month_name}: {days_in_month:2d} 天")
@@ -149,9 +143,7 @@ def main():
     print("\n2023年:")
     total_2023 = 0
     for month_name, m_start, m_end in months_2023:
-        m_start_dt = datetime.strptime(m_start, "%Y-%m-%d")
-        m_end_dt = datetime.strptime(m_end, "%Y-%m-%d")
-        days_in_month = (m_end_dt - m_start_dt).days + 1
+        days_in_month = (date.fromisoformat(m_end) - date.fromisoformat(m_start)).days + 1
         total_2023 += days_in_month
         print(f"  {month_name}: {days_in_month:2d} 天")
 
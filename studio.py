@@ -10,12 +10,34 @@ Usage:
     3. Connect to http://127.0.0.1:2024
 """
 
+from functools import cache
+
 from app.agents.workflow import build_workflow
 from app.agents.state import WorkflowState, create_initial_state
 
-# Build and compile the workflow graph
+# Compiled workflow graph, built on first call of get_graph()
 # This is the object that LangGraph Studio will visualize
-graph = build_workflow().compile()
+_graph = None
+
+
+def get_graph():
+    """Build and compile the workflow graph once, on first use.
+
+    langgraph.json points at this factory: the server looks graph entries up
+    in the module __dict__, so the lazy ``studio.graph`` attribute below is
+    not visible to it.
+    """
+    global _graph
+    if _graph is None:
+        _graph = build_workflow().compile()
+    return _graph
+
+
+def __getattr__(name: str):
+    # Lazy ``studio.graph`` for regular imports; importing studio does not compile the graph
+    if name == "graph":
+        return get_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def create_test_state(
@@ -60,25 +82,44 @@ def create_test_state(
     )
 
 
-# Pre-built test states for common testing scenarios
-TEST_STATES = {
-    "muchen": create_test_state(
-        creditor_name="上海牧诚贸易有限公司",
-        materials_path="/Users/chenchu/Desktop/第1批债权/债权申报书-上海牧诚贸易有限公司.md"
-    ),
-    "baoxin": create_test_state(
-        creditor_name="上海宝信软件股份有限公司",
-        materials_path="/Users/chenchu/Desktop/第1批债权/债权申报书-上海宝信软件股份有限公司.md"
-    ),
-    "chengying": create_test_state(
-        creditor_name="上海成盈贸易有限公司",
-        materials_path="/Users/chenchu/Desktop/第1批债权/债权申报书-上海成盈贸易有限公司.md"
-    )
+# Test data for common testing scenarios (states are built on first use)
+TEST_STATE_CREDITORS = {
+    "muchen": {
+        "creditor_name": "上海牧诚贸易有限公司",
+        "materials_path": "/Users/chenchu/Desktop/第1批债权/债权申报书-上海牧诚贸易有限公司.md"
+    },
+    "baoxin": {
+        "creditor_name": "上海宝信软件股份有限公司",
+        "materials_path": "/Users/chenchu/Desktop/第1批债权/债权申报书-上海宝信软件股份有限公司.md"
+    },
+    "chengying": {
+        "creditor_name": "上海成盈贸易有限公司",
+        "materials_path": "/Users/chenchu/Desktop/第1批债权/债权申报书-上海成盈贸易有限公司.md"
+    }
 }
 
 
+@cache
+def get_test_state(name: str) -> WorkflowState:
+    """
+    Get a pre-built test state by scenario name, building it on first access.
+
+    Args:
+        name: Scenario name, one of TEST_STATE_CREDITORS ("muchen", "baoxin", "chengying")
+
+    Returns:
+        Initial workflow state for the scenario (shared across calls)
+    """
+    try:
+        creditor = TEST_STATE_CREDITORS[name]
+    except KeyError:
+        raise KeyError(f"Unknown test state: {name!r}") from None
+    return create_test_state(**creditor)
+
+
 if __name__ == "__main__":
     # Quick verification that graph compiles correctly
+    graph = get_graph()
     print("Workflow graph compiled successfully!")
     print(f"Graph nodes: {list(graph.nodes.keys())}")
     print(f"Entry point: init")
@@ -0,0 +1,83 @@
+"""
+Coalesce independent LLM calls made during tests into batched dispatches.
+
+Calls submitted within a short window (LLM_BATCH_WINDOW_MS, default 50) are
+collected and sent through one batch function such as `llm.abatch`. Each
+caller still awaits only its own result.
+"""
+
+import asyncio
+import os
+from collections import deque
+from typing import Any, Awaitable, Callable, List
+
+BATCH_WINDOW = int(os.environ.get("LLM_BATCH_WINDOW_MS", "50")) / 1000
+
+BATCH_MAX_SIZE = int(os.environ.get("LLM_BATCH_MAX_SIZE", "8"))
+
+
+class AsyncBatcher:
+    """Collects submitted items and dispatches them to fn as one list."""
+
+    def __init__(
+        self,
+        fn: Callable[[List[Any]], Awaitable[List[Any]]],
+        window: float = BATCH_WINDOW,
+        max_size: int = BATCH_MAX_SIZE,
+    ):
+        self._fn = fn
+        self._window = window
+        self._max_size = max_size
+        self._pending: deque = deque()
+        self._flush_task = None
+        # Strong references so dispatch tasks are not garbage-collected mid-flight
+        self._tasks = set()
+
+    async def submit(self, item: Any) -> Any:
+        """Queue item for the next batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self._max_size:
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+                self._flush_task = None
+            self._spawn(self._dispatch(self._take()))
+        elif self._flush_task is None:
+            self._flush_task = self._spawn(self._flush_after_window())
+
+        return await future
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _take(self) -> list:
+        batch = list(self._pending)
+        self._pending.clear()
+        return batch
+
+    async def _flush_after_window(self):
+        await asyncio.sleep(self._window)
+        # Clear first: from here on this task must not be cancelled by submit()
+        self._flush_task = None
+        await self._dispatch(self._take())
+
+    async def _dispatch(self, batch: list):
+        if not batch:
+            return
+
+        try:
+            results = await self._fn([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
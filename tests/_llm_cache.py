@@ -0,0 +1,83 @@
+"""
+Content-addressed disk cache for LLM calls made during tests.
+
+Responses are stored as JSON under tests/.llm_cache/, keyed by a SHA-256 of
+the model name and the prompt. A second run of the e2e suite with the same
+prompts replays the stored responses instead of calling DeepSeek again.
+
+Set DEBT_REVIEW_LLM_CACHE=0 to bypass the cache and always call the API.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable
+
+CACHE_DIR = Path(__file__).resolve().parent / ".llm_cache"
+
+CACHE_ENABLED = os.environ.get("DEBT_REVIEW_LLM_CACHE", "1") != "0"
+
+
+def cache_key(parts: Iterable[str]) -> str:
+    """Hash the parts, length-prefixing each so boundaries cannot collide."""
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _serialize_prompt(prompt: Any) -> str:
+    """Stable text form of a prompt (a string or a list of chat messages)."""
+    if isinstance(prompt, str):
+        return prompt
+    messages = [
+        [getattr(m, "type", type(m).__name__), getattr(m, "content", m)]
+        for m in prompt
+    ]
+    return json.dumps(messages, ensure_ascii=False, sort_keys=True, default=str)
+
+
+async def cached_call(key: str, fn: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Return the stored response for key, or await fn() and store its result."""
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        pass
+
+    response = await fn()
+
+    # Atomic write: a concurrent reader never sees a partial file
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(response, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return response
+
+
+class CachedLLM:
+    """Wraps a chat model so ainvoke() goes through the disk cache."""
+
+    def __init__(self, llm: Any):
+        self._llm = llm
+        self._model = getattr(llm, "model_name", None) or getattr(llm, "model", "")
+
+    async def ainvoke(self, prompt: Any, *args: Any, **kwargs: Any):
+        from langchain_core.messages import AIMessage
+
+        async def call() -> Dict[str, Any]:
+            response = await self._llm.ainvoke(prompt, *args, **kwargs)
+            return {"content": response.content}
+
+        key = cache_key([str(self._model), _serialize_prompt(prompt)])
+        response = await cached_call(key, call)
+        return AIMessage(content=response["content"])
+
+    def __getattr__(self, name: str):
+        return getattr(self._llm, name)
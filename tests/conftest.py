@@ -0,0 +1,89 @@
+"""
+Shared pytest setup for the test suite.
+
+Puts the project root on sys.path once so test modules can import `app`,
+provides the fixtures shared across test modules, and gates the e2e tests
+behind the --run-e2e / --e2e-gather options.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+
+@pytest.fixture(scope="session")
+def km():
+    """The KnowledgeManager singleton, shared across the session."""
+    from app.knowledge import get_knowledge_manager
+    return get_knowledge_manager()
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed (via uvicorn[standard])."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def deepseek_available():
+    """Whether a real DEEPSEEK_API_KEY is configured, checked once per session."""
+    from app.core.config import settings
+    key = settings.DEEPSEEK_API_KEY
+    return bool(key) and key != "your_deepseek_api_key_here"
+
+
+@pytest.fixture(scope="session")
+def require_deepseek(deepseek_available):
+    """Skip the requesting test when the DeepSeek API is not configured."""
+    if not deepseek_available:
+        pytest.skip("DEEPSEEK_API_KEY not configured")
+
+
+def pytest_addoption(parser):
+    """Add custom pytest options."""
+    parser.addoption(
+        "--run-e2e",
+        action="store_true",
+        default=False,
+        help="Run end-to-end tests that require LLM API"
+    )
+    parser.addoption(
+        "--e2e-gather",
+        action="store_true",
+        default=False,
+        help="Run the e2e workflows concurrently in one test (with --run-e2e)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip e2e tests unless --run-e2e is specified.
+
+    With --e2e-gather the combined concurrent test replaces the individual
+    e2e tests, so each workflow is only billed once.
+    """
+    if not config.getoption("--run-e2e"):
+        skip_e2e = pytest.mark.skip(reason="Need --run-e2e option to run")
+        for item in items:
+            if "e2e" in item.keywords:
+                item.add_marker(skip_e2e)
+        return
+
+    gather = config.getoption("--e2e-gather")
+    skip_gather = pytest.mark.skip(reason="Need --e2e-gather option to run")
+    skip_covered = pytest.mark.skip(reason="Covered by test_e2e_gather")
+    for item in items:
+        if "e2e_gather" in item.keywords:
+            if not gather:
+                item.add_marker(skip_gather)
+        elif "e2e" in item.keywords and gather:
+            item.add_marker(skip_covered)
@@ -8,11 +8,9 @@ from batch 9 and compares results with the target outputs from the original solu
 import asyncio
 import sys
 import os
-from pathlib import Path
-from datetime import datetime
-
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import time
+import traceback
+from types import MappingProxyType
 
 from app.agents.workflow import run_workflow_with_auto_mode, get_workflow_app
 from app.agents.state import create_initial_state
@@ -49,14 +47,33 @@ BATCH_9_CREDITORS = [
     }
 ]
 
-# Shared context for batch 9
-BATCH_9_CONTEXT = {
+# Shared context for batch 9 (read-only; copy with dict() to mutate)
+BATCH_9_CONTEXT = MappingProxyType({
     "debtor_name": "江苏熔盛重工有限公司",
     "bankruptcy_date": "2025-09-16",  # 破产受理日
     "interest_stop_date": "2025-09-16",
-    "task_id": f"batch9-test-{datetime.now().strftime('%Y%m%d%H%M%S')}",
+    "task_id": f"batch9-test-{time.strftime('%Y%m%d%H%M%S')}",
     "project_id": "batch-9-financial-creditors"
-}
+})
+
+# Set BATCH9_ALL_CREDITORS=1 to run every creditor (default: first creditor only)
+RUN_ALL_CREDITORS = os.environ.get("BATCH9_ALL_CREDITORS") == "1"
+
+# Max creditors processed concurrently when running the whole batch
+MAX_CONCURRENT = int(os.environ.get("BATCH9_MAX_CONCURRENT", "2"))
+
+# Set DEBT_TEST_VERBOSE=1 to print full tracebacks for failed creditors
+_VERBOSE = os.getenv("DEBT_TEST_VERBOSE") == "1"
+
+
+def _iter_files(root: str):
+    """Yield (path, size) for every file under root, reusing scandir's cached stat."""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path)
+            elif entry.is_file():
+                yield entry.path, entry.stat().st_size
 
 
 async def test_single_creditor(creditor_config: dict, shared_context: dict):
@@ -78,20 +95,19 @@ async def test_single_creditor(creditor_config: dict, shared_context: dict):
         print(f"Failure count: {result.get('failure_count', 0)}")
 
         # Check for outputs
-        output_path = Path(creditor_config['output_path'])
-        if output_path.exists():
+        output_path = creditor_config['output_path']
+        if os.path.isdir(output_path):
             print(f"\nGenerated files:")
-            for item in output_path.rglob("*"):
-                if item.is_file():
-                    print(f"  - {item.relative_to(output_path)}: {item.stat().st_size} bytes")
+            for file_path, size in _iter_files(output_path):
+                print(f"  - {os.path.relpath(file_path, output_path)}: {size} bytes")
 
         return result
 
     except Exception as e:
         print(f"ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-        return {"error": str(e)}
+        if _VERBOSE:
+            traceback.print_exc()
+        return {"error": str(e), "exc_type": type(e).__name__}
 
 
 async def test_batch9_workflow():
@@ -103,11 +119,35 @@ async def test_batch9_workflow():
     print(f"Bankruptcy Date: {BATCH_9_CONTEXT['bankruptcy_date']}")
     print(f"Creditors: {len(BATCH_9_CREDITORS)}")
 
-    # Test only the first creditor (most complex case)
+    # By default test only the first creditor (most complex case)
     # to avoid long processing time
-    test_creditor = BATCH_9_CREDITORS[0]
+    creditors = BATCH_9_CREDITORS if RUN_ALL_CREDITORS else BATCH_9_CREDITORS[:1]
 
-    result = await test_single_creditor(test_creditor, BATCH_9_CONTEXT)
+    if len(creditors) == 1:
+        result = await test_single_creditor(creditors[0], BATCH_9_CONTEXT)
+    else:
+        # LLM-bound: overlap creditors, bounded by MAX_CONCURRENT
+        sem = asyncio.Semaphore(MAX_CONCURRENT)
+
+        async def _one(creditor_config):
+            async with sem:
+                return await test_single_creditor(creditor_config, BATCH_9_CONTEXT)
+
+        results = await asyncio.gather(*[_one(c) for c in creditors], return_exceptions=True)
+
+        # Aggregate per-creditor results
+        result = {"mode": "batch", "success_count": 0, "failure_count": 0, "results": results}
+        errors = []
+        for creditor_result in results:
+            if isinstance(creditor_result, BaseException):
+                errors.append(str(creditor_result))
+            elif "error" in creditor_result:
+                errors.append(creditor_result["error"])
+            else:
+                result["success_count"] += creditor_result.get("success_count", 0)
+                result["failure_count"] += creditor_result.get("failure_count", 0)
+        if errors:
+            result["error"] = "; ".join(errors)
 
     # Print summary
     print("\n" + "="*70)
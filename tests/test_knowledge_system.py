@@ -9,7 +9,9 @@ Validates:
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
+import os
 from pathlib import Path
 import sys
 
@@ -21,46 +23,56 @@ from app.knowledge.loader import KnowledgeManager
 from app.knowledge.schemas import KnowledgeItem, LPRData
 
 
+KNOWLEDGE_DIR = Path(__file__).resolve().parent.parent / 'app' / 'knowledge'
+
+# Knowledge modules every deployment must ship
+EXPECTED_MODULES = (
+    'foundations',
+    'calculations',
+    'fact_checking',
+    'analysis',
+    'report',
+    'legal_standards'
+)
+
+
+@pytest_asyncio.fixture(autouse=True, scope="session", loop_scope="session")
+async def prewarm_knowledge(km):
+    """Load the hot knowledge set once so tests start from a warm cache."""
+    await asyncio.gather(
+        km.get_knowledge('foundations', 'core_principles'),
+        km.get_lpr_rates(),
+        km.get_knowledge_for_stage('analysis', 3000),
+        km.get_knowledge_for_stage('fact_check', 3000),
+    )
+
+
 class TestKnowledgeManager:
     """Tests for KnowledgeManager core functionality."""
 
-    def test_singleton_pattern(self):
+    def test_singleton_pattern(self, km):
         """Verify KnowledgeManager is a singleton."""
-        km1 = get_knowledge_manager()
-        km2 = get_knowledge_manager()
-        assert km1 is km2, "KnowledgeManager should be a singleton"
+        assert get_knowledge_manager() is km, "KnowledgeManager should be a singleton"
 
-    def test_registry_populated(self):
+    def test_registry_populated(self, km):
         """Verify registry is populated with expected modules."""
-        km = get_knowledge_manager()
-        categories = km.list_categories()
+        categories = frozenset(km.list_categories())
 
-        expected_categories = [
-            'foundations',
-            'calculations',
-            'fact_checking',
-            'analysis',
-            'report',
-            'legal_standards'
-        ]
+        missing = set(EXPECTED_MODULES) - categories
+        assert not missing, f"Missing categories: {sorted(missing)}"
 
-        for cat in expected_categories:
-            assert cat in categories, f"Missing category: {cat}"
-
-    def test_list_knowledge_foundations(self):
+    def test_list_knowledge_foundations(self, km):
         """Verify foundations module has expected files."""
-        km = get_knowledge_manager()
         items = km.list_knowledge('foundations')
 
         assert len(items) > 0, "Foundations should have knowledge items"
 
         # Check for core_principles
-        ids = [item['id'] for item in items]
+        ids = {item['id'] for item in items}
         assert 'core_principles' in ids, "core_principles should exist"
 
-    def test_cache_stats(self):
+    def test_cache_stats(self, km):
         """Verify cache statistics are available."""
-        km = get_knowledge_manager()
         stats = km.get_cache_stats()
 
         assert 'size' in stats
@@ -72,9 +84,8 @@ class TestKnowledgeLoading:
     """Tests for knowledge file loading."""
 
     @pytest.mark.asyncio
-    async def test_load_single_knowledge(self):
+    async def test_load_single_knowledge(self, km):
         """Test loading a single knowledge item."""
-        km = get_knowledge_manager()
         knowledge = await km.get_knowledge('foundations', 'core_principles')
 
         assert knowledge is not None, "Should load core_principles"
@@ -83,10 +94,8 @@ class TestKnowledgeLoading:
         assert len(knowledge.content) > 0, "Content should not be empty"
 
     @pytest.mark.asyncio
-    async def test_load_knowledge_for_stage(self):
+    async def test_load_knowledge_for_stage(self, km):
         """Test loading knowledge for a workflow stage."""
-        km = get_knowledge_manager()
-
         # Load for analysis stage
         items = await km.get_knowledge_for_stage(
             stage='analysis',
@@ -97,27 +106,24 @@ class TestKnowledgeLoading:
         assert len(items) > 0, "Should load some knowledge for analysis stage"
 
         # All items should be applicable to analysis
-        for item in items:
-            assert item.applies_to_stage('analysis'), \
-                f"{item.id} should apply to analysis stage"
+        bad = next((item for item in items if not item.applies_to_stage('analysis')), None)
+        assert bad is None, f"{bad.id} should apply to analysis stage"
 
     @pytest.mark.asyncio
-    async def test_token_budget_respected(self):
+    async def test_token_budget_respected(self, km):
         """Test that token budget limits are respected."""
-        km = get_knowledge_manager()
-
-        # Load with very small budget
-        items_small = await km.get_knowledge_for_stage(
-            stage='analysis',
-            token_budget=500,
-            include_advanced=False
-        )
-
-        # Load with larger budget
-        items_large = await km.get_knowledge_for_stage(
-            stage='analysis',
-            token_budget=5000,
-            include_advanced=False
+        # Load with a very small and a larger budget concurrently
+        items_small, items_large = await asyncio.gather(
+            km.get_knowledge_for_stage(
+                stage='analysis',
+                token_budget=500,
+                include_advanced=False
+            ),
+            km.get_knowledge_for_stage(
+                stage='analysis',
+                token_budget=5000,
+                include_advanced=False
+            ),
         )
 
         # Smaller budget should load fewer or equal items
@@ -125,10 +131,38 @@ class TestKnowledgeLoading:
             "Smaller budget should not load more items"
 
     @pytest.mark.asyncio
-    async def test_force_reload(self):
-        """Test force reload bypasses cache."""
-        km = get_knowledge_manager()
+    @pytest.mark.parametrize("stage,token_budget,expected", [
+        ('fact_check', 1000, [
+            'foundations:core_principles', 'fact_checking:syndicated_loan_guide',
+        ]),
+        ('fact_check', 5000, [
+            'foundations:core_principles', 'calculations:lpr_rates',
+            'fact_checking:declaration_extraction', 'analysis:financial_multi_loan',
+        ]),
+        ('analysis', 1000, [
+            'foundations:core_principles', 'calculations:calculator_guide',
+        ]),
+        ('analysis', 3000, [
+            'foundations:core_principles', 'calculations:lpr_rates',
+            'fact_checking:syndicated_loan_guide', 'foundations:evidence_hierarchy',
+            'calculations:formulas',
+        ]),
+        ('report', 3000, [
+            'foundations:core_principles', 'calculations:lpr_rates',
+            'fact_checking:syndicated_loan_guide', 'foundations:debt_classification',
+            'foundations:critical_dates',
+        ]),
+    ])
+    async def test_stage_selection(self, km, stage, token_budget, expected):
+        """Pin the items each stage selects: category coverage first, then value per token."""
+        items = await km.get_knowledge_for_stage(stage=stage, token_budget=token_budget)
+
+        assert [f"{item.category}:{item.id}" for item in items] == expected
+        assert sum(item.token_estimate for item in items) <= token_budget
 
+    @pytest.mark.asyncio
+    async def test_force_reload(self, km):
+        """Test force reload bypasses cache."""
         # Load once
         knowledge1 = await km.get_knowledge('foundations', 'core_principles')
 
@@ -149,9 +183,8 @@ class TestLPRData:
     """Tests for LPR data loading."""
 
     @pytest.mark.asyncio
-    async def test_load_lpr_rates(self):
+    async def test_load_lpr_rates(self, km):
         """Test loading LPR rates from YAML."""
-        km = get_knowledge_manager()
         lpr_data = await km.get_lpr_rates()
 
         assert lpr_data is not None
@@ -159,9 +192,8 @@ class TestLPRData:
         assert len(lpr_data.rates) > 0, "Should have LPR rates"
 
     @pytest.mark.asyncio
-    async def test_lpr_rate_structure(self):
+    async def test_lpr_rate_structure(self, km):
         """Test LPR rate data structure."""
-        km = get_knowledge_manager()
         lpr_data = await km.get_lpr_rates()
 
         # Check first rate entry
@@ -185,88 +217,92 @@ class TestLPRData:
 class TestPromptBuilding:
     """Tests for dynamic prompt building."""
 
+    @pytest.fixture(autouse=True, scope="class")
+    def memoized_stage_knowledge(self, km):
+        """Memoize stage knowledge loads; these tests exercise prompt assembly."""
+        original = km.get_knowledge_for_stage
+        loaded = {}
+
+        async def get_knowledge_for_stage(stage, token_budget=4000, include_advanced=False, categories=None):
+            key = (stage, token_budget, include_advanced, tuple(categories or ()))
+            if key not in loaded:
+                loaded[key] = await original(stage, token_budget, include_advanced, categories)
+            return loaded[key]
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(km, "get_knowledge_for_stage", get_knowledge_for_stage)
+            yield
+
     @pytest.mark.asyncio
-    async def test_build_system_prompt(self):
-        """Test building system prompt with dynamic knowledge."""
+    async def test_all_prompts(self):
+        """Build the system, fact-check and analysis prompts concurrently."""
         try:
-            from app.agents.llm import build_system_prompt
+            from app.agents.llm import (
+                build_system_prompt,
+                create_fact_check_prompt_async,
+                create_analysis_prompt_async
+            )
         except ImportError:
             pytest.skip("langchain_openai not installed")
 
-        prompt = await build_system_prompt(
-            stage='analysis',
-            bankruptcy_date='2024-01-15',
-            token_budget=2000,
-            include_advanced=False
+        prompt, fact_check_messages, analysis_messages = await asyncio.gather(
+            build_system_prompt(
+                stage='analysis',
+                bankruptcy_date='2024-01-15',
+                token_budget=2000,
+                include_advanced=False
+            ),
+            create_fact_check_prompt_async(
+                creditor_name='测试债权人',
+                materials_path='/test/path',
+                bankruptcy_date='2024-01-15',
+                debtor_name='测试债务人',
+                use_dynamic_knowledge=True
+            ),
+            create_analysis_prompt_async(
+                creditor_name='测试债权人',
+                fact_check_report='测试事实核查报告内容',
+                bankruptcy_date='2024-01-15',
+                interest_stop_date='2024-01-14',
+                declared_amounts={'principal': 100000, 'interest': 5000},
+                use_dynamic_knowledge=True
+            )
         )
 
+        # System prompt
         assert len(prompt) > 0, "Prompt should not be empty"
         assert '2024-01-15' in prompt, "Bankruptcy date should be in prompt"
         assert '审查知识库' in prompt, "Knowledge section header should be present"
 
-    @pytest.mark.asyncio
-    async def test_fact_check_prompt_async(self):
-        """Test async fact-check prompt creation."""
-        try:
-            from app.agents.llm import create_fact_check_prompt_async
-        except ImportError:
-            pytest.skip("langchain_openai not installed")
+        # Fact-check prompt
+        assert len(fact_check_messages) == 2, "Should have system and human messages"
+        assert fact_check_messages[0].content is not None
+        assert fact_check_messages[1].content is not None
 
-        messages = await create_fact_check_prompt_async(
-            creditor_name='测试债权人',
-            materials_path='/test/path',
-            bankruptcy_date='2024-01-15',
-            debtor_name='测试债务人',
-            use_dynamic_knowledge=True
-        )
+        # Analysis prompt should have knowledge loaded
+        assert len(analysis_messages) == 2
+        assert len(analysis_messages[0].content) > 500, "Should have substantial knowledge content"
 
-        assert len(messages) == 2, "Should have system and human messages"
-        assert messages[0].content is not None
-        assert messages[1].content is not None
 
-    @pytest.mark.asyncio
-    async def test_analysis_prompt_async(self):
-        """Test async analysis prompt creation."""
-        try:
-            from app.agents.llm import create_analysis_prompt_async
-        except ImportError:
-            pytest.skip("langchain_openai not installed")
-
-        messages = await create_analysis_prompt_async(
-            creditor_name='测试债权人',
-            fact_check_report='测试事实核查报告内容',
-            bankruptcy_date='2024-01-15',
-            interest_stop_date='2024-01-14',
-            declared_amounts={'principal': 100000, 'interest': 5000},
-            use_dynamic_knowledge=True
-        )
-
-        assert len(messages) == 2
-        # Analysis should have knowledge loaded
-        assert len(messages[0].content) > 500, "Should have substantial knowledge content"
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def analysis_items(km):
+    """Analysis-stage knowledge items, loaded once for the formatting tests."""
+    return await km.get_knowledge_for_stage('analysis', token_budget=1000)
 
 
 class TestKnowledgeFormatting:
     """Tests for knowledge formatting."""
 
-    @pytest.mark.asyncio
-    async def test_format_full(self):
+    def test_format_full(self, km, analysis_items):
         """Test full format output."""
-        km = get_knowledge_manager()
-        items = await km.get_knowledge_for_stage('analysis', token_budget=1000)
-
-        formatted = km.format_for_prompt(items, format_type='full')
+        formatted = km.format_for_prompt(analysis_items, format_type='full')
 
         assert len(formatted) > 0
         assert '###' in formatted, "Full format should have headers"
 
-    @pytest.mark.asyncio
-    async def test_format_structured(self):
+    def test_format_structured(self, km, analysis_items):
         """Test structured format output."""
-        km = get_knowledge_manager()
-        items = await km.get_knowledge_for_stage('analysis', token_budget=1000)
-
-        formatted = km.format_for_prompt(items, format_type='structured')
+        formatted = km.format_for_prompt(analysis_items, format_type='structured')
 
         assert len(formatted) > 0
         assert '[' in formatted, "Structured format should have brackets"
@@ -275,27 +311,21 @@ class TestKnowledgeFormatting:
 class TestModuleIntegrity:
     """Tests for module file integrity."""
 
-    def test_all_index_files_exist(self):
-        """Verify all module _index.yaml files exist."""
-        knowledge_dir = Path(__file__).parent.parent / 'app' / 'knowledge'
-
-        expected_modules = [
-            'foundations',
-            'calculations',
-            'fact_checking',
-            'analysis',
-            'report',
-            'legal_standards'
-        ]
-
-        for module in expected_modules:
-            index_path = knowledge_dir / module / '_index.yaml'
-            assert index_path.exists(), f"Missing _index.yaml for {module}"
-
-    def test_lpr_rates_file_exists(self):
-        """Verify LPR rates YAML file exists."""
-        lpr_path = Path(__file__).parent.parent / 'app' / 'knowledge' / 'calculations' / 'lpr_rates.yaml'
-        assert lpr_path.exists(), "LPR rates file should exist"
+    @pytest.mark.asyncio
+    async def test_all_index_files_exist(self):
+        """Verify all module _index.yaml files and the LPR rates file exist."""
+        with os.scandir(KNOWLEDGE_DIR) as it:
+            module_dirs = {entry.name for entry in it if entry.is_dir()}
+        missing_modules = [m for m in EXPECTED_MODULES if m not in module_dirs]
+        assert not missing_modules, f"Missing modules: {missing_modules}"
+
+        # Independent stats, issued concurrently off the event loop
+        paths = [KNOWLEDGE_DIR / m / '_index.yaml' for m in EXPECTED_MODULES]
+        paths.append(KNOWLEDGE_DIR / 'calculations' / 'lpr_rates.yaml')
+        exists = await asyncio.gather(*(asyncio.to_thread(p.is_file) for p in paths))
+
+        missing = [str(p.relative_to(KNOWLEDGE_DIR)) for p, ok in zip(paths, exists) if not ok]
+        assert not missing, f"Missing knowledge files: {missing}"
 
 
 if __name__ == '__main__':
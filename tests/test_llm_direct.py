@@ -10,24 +10,27 @@ Validates:
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
+import httpx
+import mmap
+import os
+import re
+import weakref
+from functools import lru_cache
 from pathlib import Path
 import sys
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.agents.llm import (
-    get_llm,
-    get_fact_check_system,
-    get_analysis_system,
-    create_fact_check_prompt,
-    create_analysis_prompt
-)
+# app.agents.llm and langchain are imported inside the tests that use them,
+# so collecting or running only the non-LLM tests never loads them
 from app.knowledge import get_knowledge_manager
 from app.agents.templates import enforce_template_compliance, validate_report_format
 from app.agents.checkpoints import QualityCheckpoints
-from langchain_core.messages import SystemMessage, HumanMessage
+
+import _llm_batch
 
 
 # Test configuration
@@ -53,37 +56,251 @@ MUCHEN_CREDITOR = {
     }
 }
 
+# Characters of the materials sent in the fact-check prompt
+MATERIALS_PROMPT_CHARS = 15000
+
+# Any one of these forms of the 牧诚 principal must appear in the report
+_MUCHEN_AMOUNTS = ("7,610,000", "761万", "7610000")
+_MUCHEN_AMOUNT_RE = re.compile("|".join(map(re.escape, _MUCHEN_AMOUNTS)))
+
+# Knowledge content and analysis conclusion markers
+_KNOWLEDGE_TERMS_RE = re.compile("原则|证据")
+_CONCLUSION_TERMS_RE = re.compile("确认|审查")
+
+
+# Max in-flight LLM requests (set LLM_TEST_CONCURRENCY=1 in CI to serialize)
+LLM_CONCURRENCY = int(os.getenv("LLM_TEST_CONCURRENCY", "4"))
+
+# One semaphore per event loop, in case tests run on more than one loop
+_LLM_SEMAPHORES = weakref.WeakKeyDictionary()
+
+
+async def _call_llm(llm, messages):
+    """llm.ainvoke bounded by LLM_CONCURRENCY concurrent requests."""
+    loop = asyncio.get_running_loop()
+    sem = _LLM_SEMAPHORES.get(loop)
+    if sem is None:
+        sem = _LLM_SEMAPHORES[loop] = asyncio.Semaphore(LLM_CONCURRENCY)
+    async with sem:
+        return await llm.ainvoke(messages)
+
+
+@lru_cache(maxsize=32)
+def _validate_report_cached(report: str):
+    """validate_report_format, memoized on the report text (results are read-only here)."""
+    return validate_report_format(report)
+
+
+@lru_cache(maxsize=32)
+def _enforce_template_cached(report: str):
+    """enforce_template_compliance, memoized on the report text."""
+    return enforce_template_compliance(report)
+
+
+# Mock fact-check report (simplified)
+MOCK_FACT_CHECK_REPORT = """一、基本信息
+
+债权人：上海牧诚贸易有限公司
+债务人：上海欧卡罗家居有限公司
+统一社会信用代码：91310117MA1J273L7T
+
+二、申报金额概况
+
+申报债权总额：8,268,485.91元
+其中：
+本金：7,610,000.00元（预付货款）
+利息：342,449.99元（按LPR1.5倍计算）
+诉讼费：32,535.00元
+保全费：5,000.00元
+迟延履行利息：278,500.92元
+
+三、证据材料清单
+
+1. (2023)沪0118民初14562号民事判决书
+2. (2023)沪0118执10429号执行裁定书
+3. (2024)沪03破152号民事裁定书
+
+四、法律关系分析
+
+基础法律关系：买卖合同纠纷（采购合同）
+债权人预付货款后，债务人未按约定供货，双方协商解除合同。
+经法院判决确认债务人应返还预付款7,610,000元及相应利息。
+
+五、时间线
+
+2021-11-13：签订《采购合同》
+2023-04-25：债权人起诉
+2023-06-12：法院判决
+2023-12-25：终结执行
+2024-02-26：破产受理
+
+六、初步发现
+
+1. 已有生效判决，债权金额较为明确
+2. 需验证利息计算是否符合破产停止计息规则
+3. 迟延履行利息需核实计算期间是否超过破产受理日
+"""
+
+
+# Fact-check prompt; the creditor fields are fixed, only {materials} varies per call
+_FACT_CHECK_PROMPT_TEMPLATE = f"""请对以下债权人的申报材料进行事实核查：
+
+债权人名称：{MUCHEN_CREDITOR["name"]}
+债务人名称：{PROJECT_CONFIG["debtor_name"]}
+破产受理日期：{PROJECT_CONFIG["bankruptcy_date"]}
+
+=== 债权申报材料 ===
+
+{{materials}}  # Limit content length
+
+请按照以下结构输出事实核查报告：
+
+一、基本信息
+（债权人、债务人、联系方式等）
+
+二、申报金额概况
+（本金、利息、违约金分项列明）
+
+三、证据材料清单
+（按时间顺序列明所有材料）
+
+四、法律关系分析
+（识别基础法律关系类型）
+
+五、时间线梳理
+（重要事件按时间排列）
+
+六、初步发现
+（需要在分析阶段重点关注的问题）
+"""
+
+_DECLARED_AMOUNTS = MUCHEN_CREDITOR["declared_amounts"]
+
+# Analysis prompt; only {fact_check_report} varies per call
+_ANALYSIS_PROMPT_TEMPLATE = f"""请对以下债权进行详细分析：
+
+债权人名称：{MUCHEN_CREDITOR["name"]}
+破产受理日期：{PROJECT_CONFIG["bankruptcy_date"]}
+停止计息日期：{PROJECT_CONFIG["interest_stop_date"]}
+
+申报金额：
+- 本金：{_DECLARED_AMOUNTS['principal']:,.2f}元
+- 利息：{_DECLARED_AMOUNTS['interest']:,.2f}元
+- 合计：{_DECLARED_AMOUNTS['total']:,.2f}元
+
+事实核查报告：
+{{fact_check_report}}
+
+请按照以下结构输出债权分析报告：
+
+一、债权金额分解
+（逐项分析本金、利息、违约金等）
+
+二、利息计算验证
+（说明计算方法和结果）
+
+三、诉讼时效分析
+（判断是否超过诉讼时效）
+
+四、担保情况分析
+（如有担保，分析担保效力）
+
+五、审查结论
+（给出各项金额的确认/暂缓/不予确认建议）
+
+六、确认金额汇总
+"""
+
+
+def build_fact_check_messages(system_prompt: str, materials_content: str):
+    """Fact-check messages for 上海牧诚贸易有限公司."""
+    from langchain_core.messages import SystemMessage, HumanMessage
+
+    human_prompt = _FACT_CHECK_PROMPT_TEMPLATE.format_map(
+        {"materials": materials_content[:MATERIALS_PROMPT_CHARS]}
+    )
+
+    return [
+        SystemMessage(content=system_prompt),
+        HumanMessage(content=human_prompt)
+    ]
+
+
+def build_analysis_messages(system_prompt: str, fact_check_report: str):
+    """Analysis messages for 上海牧诚贸易有限公司 given a fact-check report."""
+    from langchain_core.messages import SystemMessage, HumanMessage
+
+    human_prompt = _ANALYSIS_PROMPT_TEMPLATE.format_map(
+        {"fact_check_report": fact_check_report}
+    )
+
+    return [
+        SystemMessage(content=system_prompt),
+        HumanMessage(content=human_prompt)
+    ]
+
+
+def _read_text_prefix(path: Path, max_chars: int) -> str:
+    """
+    Decode only the first max_chars characters of a UTF-8 file.
+
+    The file is memory-mapped and at most 4 bytes per character are decoded,
+    so large materials are never copied into a full-length str.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            raw = mm[:max_chars * 4]
+
+    try:
+        text = raw.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # Only a character cut off at the end of the window is tolerated
+        if e.end != len(raw):
+            raise
+        text = raw[:e.start].decode('utf-8')
+    return text[:max_chars]
+
+
+@pytest_asyncio.fixture(scope="session")
+async def llm(require_deepseek):
+    """One LLM for the session, sharing a pooled HTTP client across calls."""
+    from app.agents.llm import get_llm
+
+    limits = httpx.Limits(max_keepalive_connections=8, max_connections=16)
+    async with httpx.AsyncClient(timeout=600, limits=limits) as client:
+        yield get_llm(http_async_client=client)
+
+
+@pytest.fixture(scope="module")
+def muchen_materials(require_deepseek):
+    """上海牧诚贸易有限公司 materials prompt window, read once per module outside the event loop."""
+    return _read_text_prefix(MUCHEN_CREDITOR["materials_path"], MATERIALS_PROMPT_CHARS)
+
 
 class TestLLMConnection:
     """Test LLM connection and basic functionality."""
 
-    def test_llm_initialization(self):
+    def test_llm_initialization(self, require_deepseek):
         """Test that LLM can be initialized."""
-        from app.core.config import settings
-
-        if not settings.DEEPSEEK_API_KEY or settings.DEEPSEEK_API_KEY == "your_deepseek_api_key_here":
-            pytest.skip("DEEPSEEK_API_KEY not configured")
+        from app.agents.llm import get_llm
 
         llm = get_llm()
         assert llm is not None
         assert llm.model_name == "deepseek-chat"
 
     @pytest.mark.asyncio
-    async def test_simple_llm_call(self):
+    async def test_simple_llm_call(self, llm):
         """Test a simple LLM call."""
-        from app.core.config import settings
-
-        if not settings.DEEPSEEK_API_KEY or settings.DEEPSEEK_API_KEY == "your_deepseek_api_key_here":
-            pytest.skip("DEEPSEEK_API_KEY not configured")
-
-        llm = get_llm()
+        from langchain_core.messages import SystemMessage, HumanMessage
 
         messages = [
             SystemMessage(content="你是一个简洁的助手，用中文回答。"),
             HumanMessage(content="请用一句话回答：1+1等于几？")
         ]
 
-        response = await llm.ainvoke(messages)
+        response = await _call_llm(llm, messages)
 
         assert response is not None
         assert response.content is not None
@@ -108,13 +325,15 @@ class TestKnowledgeIntegration:
         content = km.format_for_prompt(items, format_type='full')
 
         assert len(content) > 100
-        assert "原则" in content or "证据" in content
+        assert _KNOWLEDGE_TERMS_RE.search(content)
 
         print(f"\nLoaded {len(items)} knowledge items, {len(content)} chars")
 
     @pytest.mark.asyncio
     async def test_dynamic_system_prompt(self):
         """Test dynamic system prompt building."""
+        from app.agents.llm import get_fact_check_system
+
         system_prompt = await get_fact_check_system(PROJECT_CONFIG["bankruptcy_date"])
 
         assert PROJECT_CONFIG["bankruptcy_date"] in system_prompt
@@ -127,67 +346,25 @@ class TestFactCheckWithLLM:
     """Test fact-check stage with actual LLM."""
 
     @pytest.mark.asyncio
-    async def test_fact_check_single_creditor(self):
+    async def test_fact_check_single_creditor(self, llm, muchen_materials):
         """
         Test fact-check for 上海牧诚贸易有限公司.
 
         This is the core E2E test - sends materials to LLM and validates response.
         """
-        from app.core.config import settings
+        from app.agents.llm import get_fact_check_system
 
-        if not settings.DEEPSEEK_API_KEY or settings.DEEPSEEK_API_KEY == "your_deepseek_api_key_here":
-            pytest.skip("DEEPSEEK_API_KEY not configured")
-
-        # Read materials
-        materials_content = MUCHEN_CREDITOR["materials_path"].read_text(encoding='utf-8')
-
-        # Get LLM
-        llm = get_llm()
+        materials_content = muchen_materials
 
         # Build prompt
         system_prompt = await get_fact_check_system(PROJECT_CONFIG["bankruptcy_date"])
-
-        human_prompt = f"""请对以下债权人的申报材料进行事实核查：
-
-债权人名称：{MUCHEN_CREDITOR["name"]}
-债务人名称：{PROJECT_CONFIG["debtor_name"]}
-破产受理日期：{PROJECT_CONFIG["bankruptcy_date"]}
-
-=== 债权申报材料 ===
-
-{materials_content[:15000]}  # Limit content length
-
-请按照以下结构输出事实核查报告：
-
-一、基本信息
-（债权人、债务人、联系方式等）
-
-二、申报金额概况
-（本金、利息、违约金分项列明）
-
-三、证据材料清单
-（按时间顺序列明所有材料）
-
-四、法律关系分析
-（识别基础法律关系类型）
-
-五、时间线梳理
-（重要事件按时间排列）
-
-六、初步发现
-（需要在分析阶段重点关注的问题）
-"""
-
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=human_prompt)
-        ]
+        messages = build_fact_check_messages(system_prompt, materials_content)
 
         print("\n正在调用 DeepSeek API 进行事实核查...")
-        print(f"材料长度: {len(materials_content)} 字符")
+        print(f"材料长度（截取）: {len(materials_content)} 字符")
 
         # Call LLM
-        response = await llm.ainvoke(messages)
+        response = await _call_llm(llm, messages)
 
         assert response is not None
         assert response.content is not None
@@ -200,10 +377,10 @@ class TestFactCheckWithLLM:
 
         # Validate content
         assert "上海牧诚贸易有限公司" in report
-        assert "7,610,000" in report or "761万" in report or "7610000" in report
+        assert _MUCHEN_AMOUNT_RE.search(report)
 
         # Check format compliance
-        validation = validate_report_format(report)
+        validation = _validate_report_cached(report)
         print(f"\n格式验证: {'通过' if validation.passed else '未通过'}")
         if not validation.passed:
             print(f"违规项: {len(validation.violations)}")
@@ -211,7 +388,7 @@ class TestFactCheckWithLLM:
                 print(f"  - {v.violation_type.value}: {v.content[:50]}")
 
         # Apply template enforcement
-        compliant_report, _ = enforce_template_compliance(report)
+        compliant_report, _ = _enforce_template_cached(report)
         print(f"\n格式转换后长度: {len(compliant_report)} 字符")
 
         # Checkpoint validation
@@ -232,124 +409,80 @@ class TestAnalysisWithLLM:
     """Test analysis stage with actual LLM."""
 
     @pytest.mark.asyncio
-    async def test_analysis_with_fact_check_report(self):
+    async def test_analysis_with_fact_check_report(self, llm):
         """
         Test analysis stage using a mock fact-check report.
         """
-        from app.core.config import settings
-
-        if not settings.DEEPSEEK_API_KEY or settings.DEEPSEEK_API_KEY == "your_deepseek_api_key_here":
-            pytest.skip("DEEPSEEK_API_KEY not configured")
-
-        # Mock fact-check report (simplified)
-        fact_check_report = """一、基本信息
-
-债权人：上海牧诚贸易有限公司
-债务人：上海欧卡罗家居有限公司
-统一社会信用代码：91310117MA1J273L7T
-
-二、申报金额概况
-
-申报债权总额：8,268,485.91元
-其中：
-本金：7,610,000.00元（预付货款）
-利息：342,449.99元（按LPR1.5倍计算）
-诉讼费：32,535.00元
-保全费：5,000.00元
-迟延履行利息：278,500.92元
-
-三、证据材料清单
-
-1. (2023)沪0118民初14562号民事判决书
-2. (2023)沪0118执10429号执行裁定书
-3. (2024)沪03破152号民事裁定书
-
-四、法律关系分析
-
-基础法律关系：买卖合同纠纷（采购合同）
-债权人预付货款后，债务人未按约定供货，双方协商解除合同。
-经法院判决确认债务人应返还预付款7,610,000元及相应利息。
-
-五、时间线
-
-2021-11-13：签订《采购合同》
-2023-04-25：债权人起诉
-2023-06-12：法院判决
-2023-12-25：终结执行
-2024-02-26：破产受理
-
-六、初步发现
-
-1. 已有生效判决，债权金额较为明确
-2. 需验证利息计算是否符合破产停止计息规则
-3. 迟延履行利息需核实计算期间是否超过破产受理日
-"""
-
-        # Get LLM
-        llm = get_llm()
+        from app.agents.llm import get_analysis_system
 
         # Build analysis prompt
         system_prompt = await get_analysis_system(PROJECT_CONFIG["bankruptcy_date"])
+        messages = build_analysis_messages(system_prompt, MOCK_FACT_CHECK_REPORT)
 
-        declared_amounts = MUCHEN_CREDITOR["declared_amounts"]
-        amounts_str = f"""- 本金：{declared_amounts['principal']:,.2f}元
-- 利息：{declared_amounts['interest']:,.2f}元
-- 合计：{declared_amounts['total']:,.2f}元"""
-
-        human_prompt = f"""请对以下债权进行详细分析：
+        print("\n正在调用 DeepSeek API 进行债权分析...")
 
-债权人名称：{MUCHEN_CREDITOR["name"]}
-破产受理日期：{PROJECT_CONFIG["bankruptcy_date"]}
-停止计息日期：{PROJECT_CONFIG["interest_stop_date"]}
+        # Call LLM
+        response = await _call_llm(llm, messages)
 
-申报金额：
-{amounts_str}
+        assert response is not None
 
-事实核查报告：
-{fact_check_report}
+        report = response.content
 
-请按照以下结构输出债权分析报告：
+        print(f"\n=== 债权分析报告 ===")
+        print(f"报告长度: {len(report)} 字符")
+        print(f"\n{report[:2000]}...")
 
-一、债权金额分解
-（逐项分析本金、利息、违约金等）
+        # Basic validation
+        assert "本金" in report
+        assert "利息" in report
+        assert _CONCLUSION_TERMS_RE.search(report)
 
-二、利息计算验证
-（说明计算方法和结果）
 
-三、诉讼时效分析
-（判断是否超过诉讼时效）
+class TestConcurrentLLMStages:
+    """Fact-check and analysis calls issued concurrently."""
 
-四、担保情况分析
-（如有担保，分析担保效力）
+    @pytest.mark.asyncio
+    async def test_fact_check_and_analysis_concurrently(self, llm, muchen_materials):
+        """
+        Run the fact-check and analysis calls together.
 
-五、审查结论
-（给出各项金额的确认/暂缓/不予确认建议）
+        The two calls are independent (analysis uses the mock report), so
+        both system prompts and both LLM round-trips are overlapped.
+        """
+        from app.agents.llm import get_fact_check_system, get_analysis_system
 
-六、确认金额汇总
-"""
+        bankruptcy_date = PROJECT_CONFIG["bankruptcy_date"]
+        system_fc, system_an = await asyncio.gather(
+            get_fact_check_system(bankruptcy_date),
+            get_analysis_system(bankruptcy_date)
+        )
 
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=human_prompt)
-        ]
+        messages_fc = build_fact_check_messages(system_fc, muchen_materials)
+        messages_an = build_analysis_messages(system_an, MOCK_FACT_CHECK_REPORT)
 
-        print("\n正在调用 DeepSeek API 进行债权分析...")
+        print("\n正在并发调用 DeepSeek API（事实核查 + 债权分析）...")
 
-        # Call LLM
-        response = await llm.ainvoke(messages)
+        # Both prompts arrive within one batching window and go out via abatch
+        batcher = _llm_batch.AsyncBatcher(
+            lambda batch: llm.abatch(batch, config={"max_concurrency": LLM_CONCURRENCY})
+        )
+        response_fc, response_an = await asyncio.gather(
+            batcher.submit(messages_fc),
+            batcher.submit(messages_an)
+        )
 
-        assert response is not None
+        fact_check_report = response_fc.content
+        analysis_report = response_an.content
 
-        report = response.content
+        print(f"\n事实核查报告长度: {len(fact_check_report)} 字符")
+        print(f"债权分析报告长度: {len(analysis_report)} 字符")
 
-        print(f"\n=== 债权分析报告 ===")
-        print(f"报告长度: {len(report)} 字符")
-        print(f"\n{report[:2000]}...")
+        assert "上海牧诚贸易有限公司" in fact_check_report
+        assert _MUCHEN_AMOUNT_RE.search(fact_check_report)
 
-        # Basic validation
-        assert "本金" in report
-        assert "利息" in report
-        assert "确认" in report or "审查" in report
+        assert "本金" in analysis_report
+        assert "利息" in analysis_report
+        assert _CONCLUSION_TERMS_RE.search(analysis_report)
 
 
 if __name__ == "__main__":
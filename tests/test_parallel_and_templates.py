@@ -16,6 +16,17 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
+@pytest.fixture(scope="module")
+def checkpoints():
+    """Quality checkpoints shared by the anti-hallucination and format tests."""
+    from app.agents.checkpoints import QualityCheckpoints
+
+    return QualityCheckpoints(
+        bankruptcy_date="2024-05-09",
+        interest_stop_date="2024-05-08"
+    )
+
+
 class TestParallelProcessing:
     """Tests for parallel processing module."""
 
@@ -236,15 +247,8 @@ class TestCheckpointIntegration:
 class TestAntiHallucination:
     """Tests for anti-hallucination checks."""
 
-    def test_inference_word_detection(self):
+    def test_inference_word_detection(self, checkpoints):
         """Test detection of inference words."""
-        from app.agents.checkpoints import QualityCheckpoints
-
-        checkpoints = QualityCheckpoints(
-            bankruptcy_date="2024-05-09",
-            interest_stop_date="2024-05-08"
-        )
-
         # Content with inference words
         content_with_inference = "根据上述材料，推测债务人可能存在还款能力"
 
@@ -252,15 +256,8 @@ class TestAntiHallucination:
         result = checkpoints._check_for_inference_words(content_with_inference)
         assert result is not None  # Found inference word
 
-    def test_clean_content_no_inference(self):
+    def test_clean_content_no_inference(self, checkpoints):
         """Test that clean content passes inference check."""
-        from app.agents.checkpoints import QualityCheckpoints
-
-        checkpoints = QualityCheckpoints(
-            bankruptcy_date="2024-05-09",
-            interest_stop_date="2024-05-08"
-        )
-
         # Clean content without inference
         clean_content = "根据借款合同第5条约定，借款本金为100万元"
 
@@ -272,15 +269,8 @@ class TestAntiHallucination:
 class TestFormatValidation:
     """Tests for format validation in checkpoints."""
 
-    def test_format_compliance_check(self):
+    def test_format_compliance_check(self, checkpoints):
         """Test format compliance checking."""
-        from app.agents.checkpoints import QualityCheckpoints
-
-        checkpoints = QualityCheckpoints(
-            bankruptcy_date="2024-05-09",
-            interest_stop_date="2024-05-08"
-        )
-
         # Content with Markdown
         markdown_content = "## 标题\n- 列表项"
 
@@ -288,15 +278,8 @@ class TestFormatValidation:
         issues = checkpoints._check_format_compliance(markdown_content)
         assert len(issues) > 0
 
-    def test_format_compliance_clean(self):
+    def test_format_compliance_clean(self, checkpoints):
         """Test that clean content passes format check."""
-        from app.agents.checkpoints import QualityCheckpoints
-
-        checkpoints = QualityCheckpoints(
-            bankruptcy_date="2024-05-09",
-            interest_stop_date="2024-05-08"
-        )
-
         # Clean content
         clean_content = "一、债权申报情况\n\n债权人申报本金100万元。"
 
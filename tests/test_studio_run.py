@@ -14,6 +14,48 @@ from pathlib import Path
 
 LANGGRAPH_API = "http://127.0.0.1:2024"
 
+# 单次工作流运行的最长等待时间（秒）
+RUN_TIMEOUT = 1800
+
+# 不支持 runs/wait 时的轮询退避参数（秒）：首次间隔、退避倍数、最大间隔
+POLL_INITIAL_DELAY = 0.25
+POLL_BACKOFF = 1.7
+POLL_MAX_DELAY = 2.0
+
+
+async def _run_with_polling(client: httpx.AsyncClient, thread_id: str, input_data: dict) -> dict:
+    """创建运行并以指数退避轮询至结束，返回与 runs/wait 相同形式的最终 values"""
+    run_resp = await client.post(
+        f"{LANGGRAPH_API}/threads/{thread_id}/runs",
+        json={
+            "assistant_id": "debt_reviewer",
+            "input": input_data
+        }
+    )
+    run_id = run_resp.json()["run_id"]
+    print(f"Run started: {run_id}")
+
+    delay = POLL_INITIAL_DELAY
+    while True:
+        status_resp = await client.get(
+            f"{LANGGRAPH_API}/threads/{thread_id}/runs/{run_id}"
+        )
+        status = status_resp.json()
+        run_status = status.get("status")
+        if run_status not in ("pending", "running"):
+            break
+        print(f"  状态: {run_status}...")
+        await asyncio.sleep(delay)
+        delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
+
+    if run_status == "error":
+        return {"__error__": status.get("error")}
+
+    state_resp = await client.get(
+        f"{LANGGRAPH_API}/threads/{thread_id}/state"
+    )
+    return state_resp.json().get("values", {})
+
 
 async def run_workflow_via_api(
     debtor_name: str,
@@ -51,45 +93,27 @@ async def run_workflow_via_api(
         print(f"在 LangStudio 中查看: {LANGGRAPH_API.replace('http://127.0.0.1:2024', 'https://smith.langchain.com/studio/?baseUrl=http://127.0.0.1:2024')}")
         print()
 
-        run_resp = await client.post(
-            f"{LANGGRAPH_API}/threads/{thread_id}/runs",
+        # 4. 创建运行并阻塞至结束，直接返回最终 values（无需轮询和额外的 /state 请求）
+        wait_resp = await client.post(
+            f"{LANGGRAPH_API}/threads/{thread_id}/runs/wait",
             json={
                 "assistant_id": "debt_reviewer",
                 "input": input_data
-            }
+            },
+            timeout=RUN_TIMEOUT
         )
-        run = run_resp.json()
-        run_id = run["run_id"]
-        print(f"Run started: {run_id}")
-
-        # 4. 轮询等待完成
-        while True:
-            status_resp = await client.get(
-                f"{LANGGRAPH_API}/threads/{thread_id}/runs/{run_id}"
-            )
-            status = status_resp.json()
-            run_status = status.get("status")
-
-            if run_status == "success":
-                print(f"\n工作流执行完成!")
-                break
-            elif run_status == "error":
-                print(f"\n工作流执行失败: {status.get('error')}")
-                break
-            elif run_status in ("pending", "running"):
-                print(f"  状态: {run_status}...")
-                await asyncio.sleep(2)
-            else:
-                print(f"  未知状态: {run_status}")
-                await asyncio.sleep(2)
-
-        # 5. 获取最终状态
-        state_resp = await client.get(
-            f"{LANGGRAPH_API}/threads/{thread_id}/state"
-        )
-        final_state = state_resp.json()
+        if wait_resp.status_code in (404, 405):
+            # 服务端不支持 runs/wait 时退回创建运行 + 指数退避轮询
+            final_values = await _run_with_polling(client, thread_id, input_data)
+        else:
+            final_values = wait_resp.json()
+
+        if "__error__" in final_values:
+            print(f"\n工作流执行失败: {final_values['__error__']}")
+        else:
+            print(f"\n工作流执行完成!")
 
-        return final_state
+        return final_values
 
 
 async def test_muchen():
@@ -109,8 +133,7 @@ async def test_muchen():
     )
 
     # 打印结果摘要
-    values = result.get("values", {})
-    creditors = values.get("creditors", [])
+    creditors = result.get("creditors", [])
 
     if creditors:
         cred = creditors[0]